@@ -1,11 +1,13 @@
 """Tineco IoT integration for Home Assistant."""
 
+import asyncio
 import logging
 from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .client import TinecoDeviceClient
 from .const import DOMAIN
 from .tineco_client_impl import TinecoClient
 
@@ -16,8 +18,6 @@ PLATFORMS = ["sensor", "switch", "binary_sensor", "select"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tineco from a config entry."""
-    from .client import TinecoDeviceClient
-
     hass.data.setdefault(DOMAIN, {})
 
     email = entry.data.get("email")
@@ -57,6 +57,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "region": region,
         "client": client,
         "device": device_ctx,
+        "bootstrap_lock": asyncio.Lock(),
     }
 
     # Create coordinator to fetch device info once per update cycle
@@ -122,6 +123,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_get_client_and_device(hass: HomeAssistant, entry: ConfigEntry):
+    """Return the shared client and device context, bootstrapping once if needed.
+
+    Serialized by a per-entry lock so concurrent entity commands cannot race
+    into parallel logins.
+    """
+    stored = hass.data[DOMAIN][entry.entry_id]
+    client = stored.get("client")
+    device_ctx = stored.get("device")
+    if client is not None and device_ctx:
+        return client, device_ctx
+
+    async with stored["bootstrap_lock"]:
+        # Re-check after acquiring the lock - another caller may have
+        # finished the bootstrap while we waited
+        client = stored.get("client")
+        device_ctx = stored.get("device")
+
+        if client is None:
+            # Recovery path only; the client is normally created at setup
+            client = TinecoDeviceClient(
+                entry.data.get("email"),
+                entry.data.get("password"),
+                stored.get("device_id"),
+                stored.get("region", "IE"),
+            )
+            if not await client.async_login():
+                _LOGGER.error("Failed to login while bootstrapping Tineco client")
+                return None, None
+            stored["client"] = client
+
+        if not device_ctx:
+            devices = await client.async_get_devices()
+            if not devices or not client.devices:
+                _LOGGER.error("No devices found while bootstrapping Tineco client")
+                return client, None
+            first = client.devices[0]
+            device_ctx = {
+                "id": first.get("did") or first.get("deviceId"),
+                "class": first.get("className", ""),
+                "resource": first.get("resource", ""),
+            }
+            stored["device"] = device_ctx
+
+    return client, device_ctx
+
+
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -1,15 +1,45 @@
 """Binary sensor platform for Tineco integration."""
 
+import asyncio
 import logging
+import time
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import async_get_client_and_device
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "tineco"
 
+# How long a shared QueryMode result stays fresh, in seconds
+_STATUS_TTL = 3.0
+
+
+async def _cached_query_mode(stored, client, device_ctx):
+    """Query the device mode once and share the result across entities.
+
+    The binary sensors poll independently and can fire within milliseconds
+    of each other; the per-entry lock plus TTL cache collapses those into
+    a single request whose result every concurrent caller reuses.
+    """
+    lock = stored.get("_status_lock")
+    if lock is None:
+        lock = stored["_status_lock"] = asyncio.Lock()
+    async with lock:
+        result, valid_until = stored.get("_status_cache", (None, 0.0))
+        if time.monotonic() < valid_until:
+            return result
+        result = await client.async_query_device_mode(
+            device_ctx.get("id"),
+            device_ctx.get("class", ""),
+            device_ctx.get("resource", ""),
+        )
+        stored["_status_cache"] = (result, time.monotonic() + _STATUS_TTL)
+        return result
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -61,43 +91,17 @@ class TinecoBaseBinarySensor(BinarySensorEntity):
     async def async_update(self):
         """Update binary sensor state."""
         try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
-            if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.debug("Failed to login during update")
-                    self._fail_count += 1
-                    if self._fail_count >= self._max_fail_before_offline:
-                        self._state = False
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.debug("No devices found")
-                    self._fail_count += 1
-                    if self._fail_count >= self._max_fail_before_offline:
-                        self._state = False
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
+            client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+            if client is None or not device_ctx:
+                _LOGGER.debug("No client or device available")
+                self._fail_count += 1
+                if self._fail_count >= self._max_fail_before_offline:
+                    self._state = False
+                return
 
             # Try a lightweight query to confirm online state
-            device_id = device_ctx.get("id")
-            device_class = device_ctx.get("class", "")
-            device_resource = device_ctx.get("resource", "")
-            status = await client.async_query_device_mode(device_id, device_class, device_resource)
+            stored = self.hass.data[DOMAIN][self.config_entry.entry_id]
+            status = await _cached_query_mode(stored, client, device_ctx)
             if status:
                 self._state = True
                 self._fail_count = 0
@@ -141,7 +145,6 @@ class TinecoChargingSensor(TinecoBaseBinarySensor):
         try:
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
             coordinator = stored.get("coordinator")
-            client = stored.get("client")
 
             # Prefer already-fetched coordinator data; fall back to a fresh query
             payload_candidates = []
@@ -149,34 +152,12 @@ class TinecoChargingSensor(TinecoBaseBinarySensor):
                 payload_candidates.extend(self._extract_payloads(coordinator.data))
 
             if not payload_candidates:
-                if client is None:
-                    from .client import TinecoDeviceClient
-                    email = self.config_entry.data.get("email")
-                    password = self.config_entry.data.get("password")
-                    client = TinecoDeviceClient(email, password)
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                    if not await client.async_login():
-                        _LOGGER.debug("Failed to login during charging update")
-                        return
-
-                device_ctx = stored.get("device")
-                if not device_ctx:
-                    devices = await client.async_get_devices()
-                    if not devices or not client.devices:
-                        _LOGGER.debug("No devices found")
-                        return
-                    first = client.devices[0]
-                    device_ctx = {
-                        "id": first.get("did") or first.get("deviceId"),
-                        "class": first.get("className", ""),
-                        "resource": first.get("resource", ""),
-                    }
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-                device_id = device_ctx.get("id")
-                device_class = device_ctx.get("class", "")
-                device_resource = device_ctx.get("resource", "")
-                status = await client.async_query_device_mode(device_id, device_class, device_resource)
+                client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+                if client is None or not device_ctx:
+                    _LOGGER.debug("No client or device available")
+                    return
+
+                status = await _cached_query_mode(stored, client, device_ctx)
                 if isinstance(status, dict):
                     payload_candidates.append(status.get("payload") or status.get("data") or status)
 
@@ -319,7 +300,6 @@ class TinecoCleanWaterTankSensor(TinecoBaseBinarySensor):
         try:
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
             coordinator = stored.get("coordinator")
-            client = stored.get("client")
 
             # Prefer already-fetched coordinator data; fall back to a fresh query
             payload_candidates = []
@@ -327,34 +307,12 @@ class TinecoCleanWaterTankSensor(TinecoBaseBinarySensor):
                 payload_candidates.extend(self._extract_payloads(coordinator.data))
 
             if not payload_candidates:
-                if client is None:
-                    from .client import TinecoDeviceClient
-                    email = self.config_entry.data.get("email")
-                    password = self.config_entry.data.get("password")
-                    client = TinecoDeviceClient(email, password)
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                    if not await client.async_login():
-                        _LOGGER.debug("Failed to login during clean water tank update")
-                        return
-
-                device_ctx = stored.get("device")
-                if not device_ctx:
-                    devices = await client.async_get_devices()
-                    if not devices or not client.devices:
-                        _LOGGER.debug("No devices found")
-                        return
-                    first = client.devices[0]
-                    device_ctx = {
-                        "id": first.get("did") or first.get("deviceId"),
-                        "class": first.get("className", ""),
-                        "resource": first.get("resource", ""),
-                    }
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-                device_id = device_ctx.get("id")
-                device_class = device_ctx.get("class", "")
-                device_resource = device_ctx.get("resource", "")
-                status = await client.async_query_device_mode(device_id, device_class, device_resource)
+                client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+                if client is None or not device_ctx:
+                    _LOGGER.debug("No client or device available")
+                    return
+
+                status = await _cached_query_mode(stored, client, device_ctx)
                 if isinstance(status, dict):
                     payload_candidates.append(status.get("payload") or status.get("data") or status)
 
@@ -435,7 +393,6 @@ class TinecoDirtyWaterTankSensor(TinecoBaseBinarySensor):
         try:
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
             coordinator = stored.get("coordinator")
-            client = stored.get("client")
 
             # Prefer already-fetched coordinator data; fall back to a fresh query
             payload_candidates = []
@@ -443,34 +400,12 @@ class TinecoDirtyWaterTankSensor(TinecoBaseBinarySensor):
                 payload_candidates.extend(self._extract_payloads(coordinator.data))
 
             if not payload_candidates:
-                if client is None:
-                    from .client import TinecoDeviceClient
-                    email = self.config_entry.data.get("email")
-                    password = self.config_entry.data.get("password")
-                    client = TinecoDeviceClient(email, password)
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                    if not await client.async_login():
-                        _LOGGER.debug("Failed to login during dirty water tank update")
-                        return
-
-                device_ctx = stored.get("device")
-                if not device_ctx:
-                    devices = await client.async_get_devices()
-                    if not devices or not client.devices:
-                        _LOGGER.debug("No devices found")
-                        return
-                    first = client.devices[0]
-                    device_ctx = {
-                        "id": first.get("did") or first.get("deviceId"),
-                        "class": first.get("className", ""),
-                        "resource": first.get("resource", ""),
-                    }
-                    self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-                device_id = device_ctx.get("id")
-                device_class = device_ctx.get("class", "")
-                device_resource = device_ctx.get("resource", "")
-                status = await client.async_query_device_mode(device_id, device_class, device_resource)
+                client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+                if client is None or not device_ctx:
+                    _LOGGER.debug("No client or device available")
+                    return
+
+                status = await _cached_query_mode(stored, client, device_ctx)
                 if isinstance(status, dict):
                     payload_candidates.append(status.get("payload") or status.get("data") or status)
 
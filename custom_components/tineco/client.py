@@ -14,7 +14,7 @@ def _run_in_executor(func):
 
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
     return wrapper
@@ -39,7 +39,7 @@ class TinecoDeviceClient:
         try:
             self.client = TinecoClient(device_id=self.device_id, region=self.region)
             # Run blocking I/O in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success, token, user_id = await loop.run_in_executor(
                 None,
                 lambda: self.client.login(self.email, self.password, request_code=False)
@@ -60,7 +60,7 @@ class TinecoDeviceClient:
         if not self._initialized or not self.client:
             return None
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             devices_response = await loop.run_in_executor(None, self.client.get_devices)
             if devices_response:
                 self.devices = self.client.device_list
@@ -74,7 +74,7 @@ class TinecoDeviceClient:
         if not self._initialized or not self.client:
             return None
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             info = await loop.run_in_executor(None, lambda: self.client.get_complete_device_info(device_id, device_class, device_resource))
             return info if info else None
         except Exception as err:
@@ -89,7 +89,7 @@ class TinecoDeviceClient:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 lambda: self.client.get_controller_info(device_id, device_class, device_resource)
@@ -106,7 +106,7 @@ class TinecoDeviceClient:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 lambda: self.client.get_api_version(device_id, device_class, device_resource)
@@ -123,7 +123,7 @@ class TinecoDeviceClient:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 lambda: self.client.get_config_file(device_id, device_class, device_resource)
@@ -140,7 +140,7 @@ class TinecoDeviceClient:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 lambda: self.client.query_device_mode(device_id, device_class, device_resource)
@@ -167,7 +167,7 @@ class TinecoDeviceClient:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 lambda: self.client.control_device(device_id, command, device_sn, device_class, action=action)
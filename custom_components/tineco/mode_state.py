@@ -0,0 +1,164 @@
+"""Shared mode state and mode command helpers for Tineco controls.
+
+The suction, MAX and water mode controls are interdependent: they share one
+mode_state dict per config entry and write to per-md configuration slots on
+the device. These helpers live in their own module so both the select and
+switch platforms can import them at module top without a circular import.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import async_get_client_and_device
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound on a single device command round-trip, in seconds
+_COMMAND_TIMEOUT = 10
+
+
+# Mode groups handled by send_mode_commands, keyed by the md slot they write
+_ALL_MODE_GROUPS = ("suction", "max", "water")
+
+
+def get_mode_state(hass: HomeAssistant, config_entry: ConfigEntry) -> dict:
+    """Get or initialize the shared mode state for interdependent controls."""
+    stored = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+
+    if "mode_state" not in stored:
+        # Initialize with default values
+        stored["mode_state"] = {
+            "suction_power": 2,              # Default to 150W
+            "max_power": 2,                  # Default to 150W
+            "max_spray_volume": 3,           # Default to Rinse
+            "water_only_mode": False,        # Default to OFF
+            "water_mode_power": 1,           # Default to 120W
+            "water_mode_spray_volume": 3,    # Default to Rinse
+        }
+        hass.data[DOMAIN][config_entry.entry_id] = stored
+
+    return stored["mode_state"]
+
+
+def update_mode_state_from_coordinator(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Update shared mode state from coordinator data (device state)."""
+    try:
+        stored = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+        coordinator = stored.get("coordinator")
+
+        if not coordinator or not coordinator.data:
+            return
+
+        mode_state = get_mode_state(hass, config_entry)
+        info = coordinator.data
+
+        # Get payload from gci or cfp
+        payload = None
+        if isinstance(info, dict):
+            if 'gci' in info and isinstance(info['gci'], dict):
+                payload = info['gci']
+            elif 'cfp' in info and isinstance(info['cfp'], dict):
+                payload = info['cfp']
+
+        if not payload:
+            return
+
+        # Update mode state from device payload
+        # Note: The device may not expose all mode parameters directly
+        # We'll update what we can find
+
+        # Check for water mode spray volume (wp field)
+        if 'wp' in payload:
+            water_spray = payload['wp']
+            mode_state["water_mode_spray_volume"] = water_spray
+            # Also update MAX spray if it's Rinse or Max
+            if water_spray >= 3:
+                mode_state["max_spray_volume"] = water_spray
+
+        # Check for water only mode (wom field)
+        if 'wom' in payload:
+            mode_state["water_only_mode"] = payload['wom'] == 1
+
+        _LOGGER.debug(f"Updated mode state from coordinator: {mode_state}")
+
+    except Exception as err:
+        _LOGGER.debug(f"Error updating mode state from coordinator: {err}")
+
+
+async def send_mode_commands(hass: HomeAssistant, config_entry: ConfigEntry,
+                             changed: tuple = _ALL_MODE_GROUPS) -> bool:
+    """Send mode commands for the changed mode groups.
+
+    The backend keeps one configuration slot per md value, so the three
+    groups cannot be merged into a single request. Callers that know which
+    group changed pass it in `changed` so only that slot is written; the
+    default rewrites all three for callers that touch interdependent state.
+    """
+    try:
+        mode_state = get_mode_state(hass, config_entry)
+
+        client, device_ctx = await async_get_client_and_device(hass, config_entry)
+        if client is None or not device_ctx:
+            _LOGGER.error("No client or device available for mode commands")
+            return False
+
+        device_id = device_ctx.get("id")
+        device_sn = device_ctx.get("resource", "")
+        device_class = device_ctx.get("class", "")
+
+        # Build one command per changed mode group; each md value is a
+        # separate configuration slot on the device
+        commands = []
+
+        if "suction" in changed:
+            # Suction mode (md=4) - UpdateMode
+            commands.append(({"md": 4, "vm": mode_state["suction_power"]}, "UpdateMode"))
+
+        if "max" in changed:
+            # MAX mode (md=3) - UpdateMode
+            commands.append(({"md": 3, "vm": mode_state["max_power"], "wm": mode_state["max_spray_volume"]}, "UpdateMode"))
+
+        if "water" in changed:
+            if mode_state["water_only_mode"]:
+                # Water mode ON - use UpdateMode with power and spray volume
+                commands.append(({
+                    "md": 6,
+                    "vm": mode_state["water_mode_power"],
+                    "wm": mode_state["water_mode_spray_volume"]
+                }, "UpdateMode"))
+            else:
+                # Water mode OFF - use DeleteMode
+                commands.append(({"md": 6}, "DeleteMode"))
+
+        # Send all commands in sequence
+        _LOGGER.info(f"Sending {len(commands)} mode commands in sequence...")
+        for i, (command, action) in enumerate(commands, 1):
+            _LOGGER.info(f"  Command {i}/{len(commands)} (action={action}): {command}")
+            async with asyncio.timeout(_COMMAND_TIMEOUT):
+                result = await client.async_control_device(device_id, command, device_sn, device_class, action=action)
+
+            if not result:
+                _LOGGER.error(f"  Failed to send command {i}: {command} - No response received")
+                return False
+
+            # Validate response - {"ret": "ok"} for UpdateMode/DeleteMode, {"cfg": [...]} for QueryMode
+            if isinstance(result, dict) and (result.get("ret") == "ok" or "cfg" in result):
+                _LOGGER.info(f"  ✓ Command {i} successful: {result}")
+            else:
+                _LOGGER.warning(f"  Command {i} sent but unexpected response: {result}")
+
+            _LOGGER.debug(f"  Command {i} full result: {result}")
+
+        _LOGGER.info("All mode commands sent successfully")
+        return True
+
+    except TimeoutError:
+        _LOGGER.warning("Mode command timed out after %ss", _COMMAND_TIMEOUT)
+        return False
+    except Exception as err:
+        _LOGGER.error(f"Error sending mode commands: {err}")
+        return False
@@ -1,12 +1,15 @@
 """Select platform for Tineco integration."""
 
 import logging
-from datetime import datetime, timedelta
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import async_get_client_and_device
+from .mode_state import get_mode_state, send_mode_commands, update_mode_state_from_coordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "tineco"
@@ -66,160 +69,6 @@ WATER_MODE_POWER_LEVELS = {
 }
 
 
-def get_mode_state(hass: HomeAssistant, config_entry: ConfigEntry) -> dict:
-    """Get or initialize the shared mode state for interdependent controls."""
-    stored = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
-
-    if "mode_state" not in stored:
-        # Initialize with default values
-        stored["mode_state"] = {
-            "suction_power": 2,              # Default to 150W
-            "max_power": 2,                  # Default to 150W
-            "max_spray_volume": 3,           # Default to Rinse
-            "water_only_mode": False,        # Default to OFF
-            "water_mode_power": 1,           # Default to 120W
-            "water_mode_spray_volume": 3,    # Default to Rinse
-        }
-        hass.data[DOMAIN][config_entry.entry_id] = stored
-
-    return stored["mode_state"]
-
-
-def update_mode_state_from_coordinator(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Update shared mode state from coordinator data (device state)."""
-    try:
-        stored = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
-        coordinator = stored.get("coordinator")
-
-        if not coordinator or not coordinator.data:
-            return
-
-        mode_state = get_mode_state(hass, config_entry)
-        info = coordinator.data
-
-        # Get payload from gci or cfp
-        payload = None
-        if isinstance(info, dict):
-            if 'gci' in info and isinstance(info['gci'], dict):
-                payload = info['gci']
-            elif 'cfp' in info and isinstance(info['cfp'], dict):
-                payload = info['cfp']
-
-        if not payload:
-            return
-
-        # Update mode state from device payload
-        # Note: The device may not expose all mode parameters directly
-        # We'll update what we can find
-
-        # Check for water mode spray volume (wp field)
-        if 'wp' in payload:
-            water_spray = payload['wp']
-            mode_state["water_mode_spray_volume"] = water_spray
-            # Also update MAX spray if it's Rinse or Max
-            if water_spray >= 3:
-                mode_state["max_spray_volume"] = water_spray
-
-        # Check for water only mode (wom field)
-        if 'wom' in payload:
-            mode_state["water_only_mode"] = payload['wom'] == 1
-
-        _LOGGER.debug(f"Updated mode state from coordinator: {mode_state}")
-
-    except Exception as err:
-        _LOGGER.debug(f"Error updating mode state from coordinator: {err}")
-
-
-async def send_mode_commands(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Send all 4 mode commands in sequence when any interdependent control changes."""
-    try:
-        stored = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
-        mode_state = get_mode_state(hass, config_entry)
-
-        client = stored.get("client")
-        if client is None:
-            from .client import TinecoDeviceClient
-            email = config_entry.data.get("email")
-            password = config_entry.data.get("password")
-            client = TinecoDeviceClient(email, password)
-            hass.data[DOMAIN][config_entry.entry_id]["client"] = client
-            if not await client.async_login():
-                _LOGGER.error("Failed to login for mode commands")
-                return False
-
-        device_ctx = stored.get("device")
-        if not device_ctx:
-            devices = await client.async_get_devices()
-            if not devices or not client.devices:
-                _LOGGER.error("No devices found for mode commands")
-                return False
-            first = client.devices[0]
-            device_ctx = {
-                "id": first.get("did") or first.get("deviceId"),
-                "class": first.get("className", ""),
-                "resource": first.get("resource", ""),
-            }
-            hass.data[DOMAIN][config_entry.entry_id]["device"] = device_ctx
-
-        device_id = device_ctx.get("id")
-        device_sn = device_ctx.get("resource", "")
-        device_class = device_ctx.get("class", "")
-
-        # Build the 4 mode commands with their corresponding actions
-        # Command 1 & 2: UpdateMode, Command 3: DeleteMode/UpdateMode, Command 4: QueryMode
-        commands = []
-
-        # Command 1: Suction mode (md=4) - UpdateMode
-        cmd1 = ({"md": 4, "vm": mode_state["suction_power"]}, "UpdateMode")
-        commands.append(cmd1)
-
-        # Command 2: MAX mode (md=3) - UpdateMode
-        cmd2 = ({"md": 3, "vm": mode_state["max_power"], "wm": mode_state["max_spray_volume"]}, "UpdateMode")
-        commands.append(cmd2)
-
-        # Command 3: Water mode (md=6)
-        if mode_state["water_only_mode"]:
-            # Water mode ON - use UpdateMode with power and spray volume
-            cmd3 = ({
-                "md": 6,
-                "vm": mode_state["water_mode_power"],
-                "wm": mode_state["water_mode_spray_volume"]
-            }, "UpdateMode")
-        else:
-            # Water mode OFF - use DeleteMode
-            cmd3 = ({"md": 6}, "DeleteMode")
-        commands.append(cmd3)
-
-        # Command 4: Query current mode configuration - QueryMode
-        cmd4 = ({}, "QueryMode")
-        commands.append(cmd4)
-
-        # Send all commands in sequence
-        _LOGGER.info(f"Sending {len(commands)} mode commands in sequence...")
-        for i, (command, action) in enumerate(commands, 1):
-            _LOGGER.info(f"  Command {i}/{len(commands)} (action={action}): {command}")
-            result = await client.async_control_device(device_id, command, device_sn, device_class, action=action)
-
-            if not result:
-                _LOGGER.error(f"  Failed to send command {i}: {command} - No response received")
-                return False
-
-            # Validate response - {"ret": "ok"} for UpdateMode/DeleteMode, {"cfg": [...]} for QueryMode
-            if isinstance(result, dict) and (result.get("ret") == "ok" or "cfg" in result):
-                _LOGGER.info(f"  ✓ Command {i} successful: {result}")
-            else:
-                _LOGGER.warning(f"  Command {i} sent but unexpected response: {result}")
-
-            _LOGGER.debug(f"  Command {i} full result: {result}")
-
-        _LOGGER.info("All mode commands sent successfully")
-        return True
-
-    except Exception as err:
-        _LOGGER.error(f"Error sending mode commands: {err}")
-        return False
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -255,7 +104,8 @@ class TinecoVolumeSelect(SelectEntity):
         self._attr_should_poll = True
         self._attr_options = list(VOLUME_LEVELS.keys())
         self._attr_current_option = "Low"
-        self._last_command_time = None
+        # Monotonic loop timestamp of the last sent command (0.0 = never)
+        self._last_command_time = 0.0
         
         email = config_entry.data.get("email", "")
         self._attr_unique_id = f"{DOMAIN}_{email}_volume_level"
@@ -287,31 +137,10 @@ class TinecoVolumeSelect(SelectEntity):
         _LOGGER.info(f"Setting volume level to {option} (vl={volume_value})")
         
         try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
-            if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.error("Failed to login for volume level command")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.error("No devices found for volume level command")
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
+            client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+            if client is None or not device_ctx:
+                _LOGGER.error("No client or device available for volume level command")
+                return
 
             device_id = device_ctx.get("id")
             device_sn = device_ctx.get("resource", "")
@@ -325,7 +154,7 @@ class TinecoVolumeSelect(SelectEntity):
             if result:
                 _LOGGER.info(f"Volume level command sent successfully: {option}, result: {result}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error("Failed to send volume level command - no result returned")
@@ -337,11 +166,10 @@ class TinecoVolumeSelect(SelectEntity):
         """Update volume level state."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
             
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
             coordinator = stored.get("coordinator")
@@ -384,7 +212,8 @@ class TinecoBaseSelect(SelectEntity):
         self._attr_should_poll = True
         self._attr_options = list(options_dict.keys())
         self._attr_current_option = list(options_dict.keys())[0]
-        self._last_command_time = None
+        # Monotonic loop timestamp of the last sent command (0.0 = never)
+        self._last_command_time = 0.0
         self._attr_icon = icon
 
         email = config_entry.data.get("email", "")
@@ -416,31 +245,10 @@ class TinecoBaseSelect(SelectEntity):
         _LOGGER.info(f"Setting {self.select_type} to {option} ({self.command_key}={value})")
 
         try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
-            if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.error(f"Failed to login for {self.select_type} command")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.error(f"No devices found for {self.select_type} command")
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
+            client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+            if client is None or not device_ctx:
+                _LOGGER.error(f"No client or device available for {self.select_type} command")
+                return
 
             device_id = device_ctx.get("id")
             device_sn = device_ctx.get("resource", "")
@@ -454,7 +262,7 @@ class TinecoBaseSelect(SelectEntity):
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}, result: {result}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command - no result returned")
@@ -466,11 +274,10 @@ class TinecoBaseSelect(SelectEntity):
         """Update select state."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
             coordinator = stored.get("coordinator")
@@ -560,12 +367,12 @@ class TinecoSuctionPowerSelect(TinecoBaseSelect):
             mode_state["suction_power"] = value
 
             # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("suction",))
 
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command")
@@ -577,11 +384,10 @@ class TinecoSuctionPowerSelect(TinecoBaseSelect):
         """Update select state from device."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             # Sync shared mode state with device state
             update_mode_state_from_coordinator(self.hass, self.config_entry)
@@ -631,12 +437,12 @@ class TinecoMaxPowerSelect(TinecoBaseSelect):
             mode_state["max_power"] = value
 
             # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("max",))
 
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command")
@@ -648,11 +454,10 @@ class TinecoMaxPowerSelect(TinecoBaseSelect):
         """Update select state from device."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             # Sync shared mode state with device state
             update_mode_state_from_coordinator(self.hass, self.config_entry)
@@ -702,12 +507,12 @@ class TinecoMaxSprayVolumeSelect(TinecoBaseSelect):
             mode_state["max_spray_volume"] = value
 
             # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("max",))
 
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command")
@@ -719,11 +524,10 @@ class TinecoMaxSprayVolumeSelect(TinecoBaseSelect):
         """Update select state from device."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             # Sync shared mode state with device state
             update_mode_state_from_coordinator(self.hass, self.config_entry)
@@ -757,27 +561,22 @@ class TinecoWaterModePowerSelect(TinecoBaseSelect):
         )
         # Override name with group prefix
         self._attr_name = "Tineco Water Mode: Power"
-        self._remove_listener = None
 
     async def async_added_to_hass(self):
-        """Register event listener when entity is added."""
+        """Register dispatcher listener when entity is added."""
         await super().async_added_to_hass()
-        
-        async def handle_water_mode_changed(event):
-            """Handle water mode changed event."""
-            if event.data.get("entry_id") == self.config_entry.entry_id:
-                self.async_write_ha_state()
-        
-        self._remove_listener = self.hass.bus.async_listen(
-            f"{DOMAIN}_water_mode_changed",
-            handle_water_mode_changed
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_water_mode_{self.config_entry.entry_id}",
+                self._handle_water_mode_changed,
+            )
         )
 
-    async def async_will_remove_from_hass(self):
-        """Remove event listener when entity is removed."""
-        if self._remove_listener:
-            self._remove_listener()
-            self._remove_listener = None
+    @callback
+    def _handle_water_mode_changed(self):
+        """Refresh availability when water only mode is toggled."""
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -803,12 +602,12 @@ class TinecoWaterModePowerSelect(TinecoBaseSelect):
             mode_state["water_mode_power"] = value
 
             # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("water",))
 
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command")
@@ -820,11 +619,10 @@ class TinecoWaterModePowerSelect(TinecoBaseSelect):
         """Update select state from device."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             # Sync shared mode state with device state
             update_mode_state_from_coordinator(self.hass, self.config_entry)
@@ -858,27 +656,22 @@ class TinecoWaterModeSprayVolumeSelect(TinecoBaseSelect):
         )
         # Override name with group prefix
         self._attr_name = "Tineco Water Mode: Spray Volume"
-        self._remove_listener = None
 
     async def async_added_to_hass(self):
-        """Register event listener when entity is added."""
+        """Register dispatcher listener when entity is added."""
         await super().async_added_to_hass()
-        
-        async def handle_water_mode_changed(event):
-            """Handle water mode changed event."""
-            if event.data.get("entry_id") == self.config_entry.entry_id:
-                self.async_write_ha_state()
-        
-        self._remove_listener = self.hass.bus.async_listen(
-            f"{DOMAIN}_water_mode_changed",
-            handle_water_mode_changed
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_water_mode_{self.config_entry.entry_id}",
+                self._handle_water_mode_changed,
+            )
         )
 
-    async def async_will_remove_from_hass(self):
-        """Remove event listener when entity is removed."""
-        if self._remove_listener:
-            self._remove_listener()
-            self._remove_listener = None
+    @callback
+    def _handle_water_mode_changed(self):
+        """Refresh availability when water only mode is toggled."""
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -904,12 +697,12 @@ class TinecoWaterModeSprayVolumeSelect(TinecoBaseSelect):
             mode_state["water_mode_spray_volume"] = value
 
             # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("water",))
 
             if result:
                 _LOGGER.info(f"{self.select_type} command sent successfully: {option}")
                 self._attr_current_option = option
-                self._last_command_time = datetime.now()
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error(f"Failed to send {self.select_type} command")
@@ -921,11 +714,10 @@ class TinecoWaterModeSprayVolumeSelect(TinecoBaseSelect):
         """Update select state from device."""
         try:
             # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
+            time_since_command = self.hass.loop.time() - self._last_command_time
+            if time_since_command < 5.0:
+                _LOGGER.debug(f"Skipping update - recent command sent {time_since_command:.1f}s ago")
+                return
 
             # Sync shared mode state with device state
             update_mode_state_from_coordinator(self.hass, self.config_entry)
@@ -1,9 +1,10 @@
 """Sensor platform for Tineco integration."""
 
 import logging
-from typing import Dict, Optional
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
-from homeassistant.core import HomeAssistant
+import re
+
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -12,6 +13,57 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "tineco"
 
+# Pre-bound state strings: the parsers always hand back these exact objects,
+# so state comparisons can use identity instead of full string equality
+_STATE_IDLE = "idle"
+_STATE_IN_OPERATION = "in_operation"
+_STATE_SELF_CLEANING = "self_cleaning"
+_STATE_CLEAN = "clean"
+_STATE_FULL = "full"
+_STATE_EMPTY = "empty"
+_STATE_NORMAL = "normal"
+_STATE_TANGLED = "tangled"
+_STATE_STUCK = "stuck"
+_STATE_NEEDS_CLEANING = "needs_cleaning"
+_STATE_UNKNOWN = "unknown"
+
+# Work-mode values that map to the self-cleaning / active states
+_SELFCLEAN_WM = frozenset({8})
+_ACTIVE_WM = frozenset({3, 4})
+
+# Target-key sets for the payload walks, built once instead of per call
+_VACUUM_KEYS = frozenset({"wm", "selfclean_process", "station", "scm", "scs"})
+_WASTE_KEYS = frozenset({"e1", "mdt"})
+_FRESH_KEYS = frozenset({"e2"})
+_BRUSH_KEYS = frozenset({"br", "brs", "brush_roller", "roller_status"})
+
+# Characters stripped from reported firmware versions, compiled once
+_FW_CLEAN_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
+
+def _pick_payload(info):
+    """Select the current-state payload, preferring gci over cfp."""
+    if not isinstance(info, dict):
+        return None
+    gci = info.get('gci')
+    if isinstance(gci, dict):
+        return gci
+    cfp = info.get('cfp')
+    return cfp if isinstance(cfp, dict) else None
+
+
+def _to_int(value):
+    """Coerce a payload field to int, returning None on bad data."""
+    if type(value) is int:
+        return value
+    if isinstance(value, (float, str)):
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
+            # Covers non-numeric strings, NaN and infinities
+            return None
+    return None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,16 +110,6 @@ class TinecoBaseSensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_name = f"Tineco {sensor_type.replace('_', ' ').title()}"
 
-    @property
-    def state(self):
-        """Return the state."""
-        return self._state
-    
-    @property
-    def native_value(self):
-        """Return the native value (used by ENUM sensors for translation)."""
-        return self._state
-
     @property
     def device_info(self):
         """Return device information."""
@@ -78,13 +120,27 @@ class TinecoBaseSensor(CoordinatorEntity, SensorEntity):
             "model": self._device_info.get("model", "IoT Device"),
         }
 
+    async def async_added_to_hass(self) -> None:
+        """Sync the fast-path attribute before the first state write.
+
+        The coordinator callback only fires on the next refresh, so without
+        this the sensor would report unknown until the first tick instead of
+        its initial default.
+        """
+        await super().async_added_to_hass()
+        self._attr_native_value = self._state
+
+    @callback
     def _handle_coordinator_update(self):
         """Handle updated data from the coordinator."""
         if self.coordinator.data:
             self._update_state_from_data(self.coordinator.data)
+        # SensorEntity reads _attr_native_value directly, skipping the
+        # property descriptor path on every state read
+        self._attr_native_value = self._state
         self.async_write_ha_state()
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info - override in subclasses."""
         pass
 
@@ -96,9 +152,13 @@ class TinecoFirmwareVersionSensor(TinecoBaseSensor):
         """Initialize."""
         super().__init__(config_entry, "firmware_version", hass, coordinator)
         self._state = "Unknown"
+        # Firmware is static per entry; once resolved, skip the re-scan
+        self._resolved = False
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
+        if self._resolved and self._state != "Unknown":
+            return
         # Try to find firmware version from endpoints
         try:
             # Check gav endpoint first (Get API Version - has firmware info)
@@ -111,6 +171,7 @@ class TinecoFirmwareVersionSensor(TinecoBaseSensor):
                     fw_clean = self._clean_version_string(str(fw))
                     if fw_clean:
                         self._state = fw_clean
+                        self._resolved = True
                         return
             
             # Fallback: check device list
@@ -123,6 +184,7 @@ class TinecoFirmwareVersionSensor(TinecoBaseSensor):
                     fw_clean = self._clean_version_string(str(fw))
                     if fw_clean:
                         self._state = fw_clean
+                        self._resolved = True
                         return
                         
             self._state = "Unknown"
@@ -135,8 +197,7 @@ class TinecoFirmwareVersionSensor(TinecoBaseSensor):
         if not version_str:
             return ""
         # Keep only alphanumeric, dots, dashes, underscores
-        import re
-        cleaned = re.sub(r'[^a-zA-Z0-9._-]', '', version_str)
+        cleaned = _FW_CLEAN_RE.sub('', version_str)
         return cleaned if cleaned else ""
     
     @property
@@ -153,7 +214,7 @@ class TinecoAPISensor(TinecoBaseSensor):
         super().__init__(config_entry, "api_version", hass, coordinator)
         self._state = "Unknown"
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
         # Try to find API version in any endpoint
         try:
@@ -205,9 +266,13 @@ class TinecoModelSensor(TinecoBaseSensor):
         """Initialize."""
         super().__init__(config_entry, "model", hass, coordinator)
         self._state = "Unknown"
+        # Model is static per entry; once resolved, skip the re-scan
+        self._resolved = False
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
+        if self._resolved and self._state != "Unknown":
+            return
         # Try to find model in device list first (most reliable)
         try:
             stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
@@ -232,6 +297,7 @@ class TinecoModelSensor(TinecoBaseSensor):
                 
                 if model and model != "Unknown":
                     self._state = str(model)
+                    self._resolved = True
                     return
             
             # Search through all endpoints
@@ -258,6 +324,7 @@ class TinecoModelSensor(TinecoBaseSensor):
                                 )
                                 if model and model != "Unknown":
                                     self._state = str(model)
+                                    self._resolved = True
                                     _LOGGER.debug(f"Found model: {model} in {endpoint_key}")
                                     return
                         
@@ -278,12 +345,12 @@ class TinecoVacuumStatusSensor(TinecoBaseSensor):
     def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant, coordinator):
         """Initialize."""
         super().__init__(config_entry, "vacuum_status", hass, coordinator)
-        self._state = "idle"
+        self._state = _STATE_IDLE
         self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = ["idle", "in_operation", "self_cleaning"]
+        self._attr_options = [_STATE_IDLE, _STATE_IN_OPERATION, _STATE_SELF_CLEANING]
         self._attr_translation_key = "vacuum_status"
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info.
         
         Based on FloorSyscBean from decompiled Tineco app:
@@ -299,14 +366,7 @@ class TinecoVacuumStatusSensor(TinecoBaseSensor):
         try:
             # Use gci (Get Controller Info) or cfp (Config Point) for current status
             # Note: query_mode.cfg is an array of mode configs, not current status
-            payload = None
-            
-            if isinstance(info, dict):
-                # Priority: gci > cfp (both contain current device state)
-                if 'gci' in info and isinstance(info['gci'], dict):
-                    payload = info['gci']
-                elif 'cfp' in info and isinstance(info['cfp'], dict):
-                    payload = info['cfp']
+            payload = _pick_payload(info)
             
             if payload:
                 status = self._parse_vacuum_status(payload)
@@ -315,13 +375,13 @@ class TinecoVacuumStatusSensor(TinecoBaseSensor):
                     return
             
             # Default to idle if we have data but can't determine status
-            self._state = "idle"
+            self._state = _STATE_IDLE
             
         except Exception as err:
             _LOGGER.error(f"Error parsing vacuum status: {err}", exc_info=True)
-            self._state = "unknown"
+            self._state = _STATE_UNKNOWN
 
-    def _parse_vacuum_status(self, payload: Dict) -> Optional[str]:
+    def _parse_vacuum_status(self, payload: dict) -> str | None:
         """Parse vacuum status from payload."""
         if not isinstance(payload, dict):
             return None
@@ -347,78 +407,50 @@ class TinecoVacuumStatusSensor(TinecoBaseSensor):
         # scs: self-clean state  
         # selfclean_process: self-clean process indicator
         # station: station status
-        fields = extract_values(payload, ["wm", "selfclean_process", "station", "scm", "scs"])
+        fields = extract_values(payload, _VACUUM_KEYS)
         
-        wm = fields.get("wm")
-        selfclean_process = fields.get("selfclean_process")
-        station = fields.get("station")
-        scm = fields.get("scm")
-        scs = fields.get("scs")
+        wm = _to_int(fields.get("wm"))
+        selfclean_process = _to_int(fields.get("selfclean_process"))
+        station = _to_int(fields.get("station"))
+        scm = _to_int(fields.get("scm"))
+        scs = _to_int(fields.get("scs"))
         
         # Priority 1: Check work mode 8 (wm=8 = self-cleaning)
         # This is the primary indicator used by the Tineco app
-        if wm is not None:
-            try:
-                work_mode = int(wm)
-                if work_mode == 8:
-                    return "self_cleaning"
-            except (ValueError, TypeError):
-                pass
+        if wm in _SELFCLEAN_WM:
+            return _STATE_SELF_CLEANING
         
         # Priority 2: Check if self-cleaning via selfclean_process > 0
-        if selfclean_process is not None:
-            try:
-                if int(selfclean_process) > 0:
-                    return "self_cleaning"
-            except (ValueError, TypeError):
-                pass
+        if selfclean_process is not None and selfclean_process > 0:
+            return _STATE_SELF_CLEANING
         
         # Priority 3: Check self-clean mode (scm) or self-clean state (scs)
-        if scm is not None:
-            try:
-                if int(scm) > 0:
-                    return "self_cleaning"
-            except (ValueError, TypeError):
-                pass
+        if scm is not None and scm > 0:
+            return _STATE_SELF_CLEANING
         
-        if scs is not None:
-            try:
-                if int(scs) > 0:
-                    return "self_cleaning"
-            except (ValueError, TypeError):
-                pass
+        if scs is not None and scs > 0:
+            return _STATE_SELF_CLEANING
         
-        # Priority 4: Check station status for self-cleaning
-        if station is not None:
-            try:
-                station_val = int(station)
-                # station=1: In self-clean mode
-                if station_val == 1:
-                    return "self_cleaning"
-            except (ValueError, TypeError):
-                pass
+        # Priority 4: Check station status (station=1 = in self-clean mode)
+        if station == 1:
+            return _STATE_SELF_CLEANING
         
         # Priority 5: Check work mode for in_operation vs idle
         if wm is not None:
-            try:
-                work_mode = int(wm)
-                # wm=3 or wm=4: In operation (actively cleaning)
-                if work_mode in (3, 4):
-                    return "in_operation"
-                # wm=0,1,2,10, etc.: Idle (standby, charging, or docked)
-                else:
-                    return "idle"
-            except (ValueError, TypeError):
-                pass
+            # wm=3 or wm=4: In operation (actively cleaning)
+            if wm in _ACTIVE_WM:
+                return _STATE_IN_OPERATION
+            # wm=0,1,2,10, etc.: Idle (standby, charging, or docked)
+            return _STATE_IDLE
         
         return None
     
     @property
     def icon(self):
         """Return the icon based on state."""
-        if self._state == "in_operation":
+        if self._state is _STATE_IN_OPERATION:
             return "mdi:vacuum"
-        elif self._state == "self_cleaning":
+        elif self._state is _STATE_SELF_CLEANING:
             return "mdi:dishwasher"
         else:  # idle or unknown
             return "mdi:home-circle"
@@ -430,31 +462,28 @@ class TinecoBatterySensor(TinecoBaseSensor):
     def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant, coordinator):
         """Initialize."""
         super().__init__(config_entry, "battery", hass, coordinator)
-        self._state = "Unknown"
-        # Optional: declare device class and unit
-        try:
-            # Avoid strict imports; set strings to be safe across versions
-            self._attr_device_class = "battery"
-            self._attr_native_unit_of_measurement = "%"
-        except Exception:
-            pass
-
-    def _update_state_from_data(self, info: Dict):
+        self._state = None
+        # Proper numeric sensor: recorder/statistics consume the int state
+        # directly without re-parsing strings
+        self._attr_device_class = SensorDeviceClass.BATTERY
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = "%"
+
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
         percent = self._extract_battery_percent(info)
         if percent is not None:
-            # clamp and convert to int/string
+            # clamp and store as int
             try:
-                percent_val = max(0, min(100, int(round(float(percent)))))
-                self._state = str(percent_val)
+                self._state = max(0, min(100, int(round(float(percent)))))
             except Exception:
-                self._state = "Unknown"
+                self._state = None
         else:
-            self._state = "Unknown"
+            self._state = None
 
-    def _extract_battery_percent(self, info: Dict):
+    def _extract_battery_percent(self, info: dict):
         """Attempt to find battery percentage across known payloads."""
-        def pick(d: Dict, keys):
+        def pick(d: dict, keys):
             for k in keys:
                 if isinstance(d, dict) and k in d and d.get(k) is not None:
                     return d.get(k)
@@ -493,6 +522,12 @@ class TinecoBatterySensor(TinecoBaseSensor):
         return None
 
     def _normalize_percent(self, val):
+        # Fast path: Tineco normally reports battery as a plain int, so skip
+        # the string/float conversion machinery for the common case
+        if type(val) is int:
+            if val >= 100:
+                return 100.0
+            return 0.0 if val < 0 else float(val)
         try:
             if isinstance(val, str):
                 v = val.strip().replace("%", "")
@@ -521,22 +556,15 @@ class TinecoWaterTankSensor(TinecoBaseSensor):
     def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant, coordinator):
         """Initialize."""
         super().__init__(config_entry, "waste_water_tank_status", hass, coordinator)
-        self._state = "clean"
+        self._state = _STATE_CLEAN
         self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = ["clean", "full"]
+        self._attr_options = [_STATE_CLEAN, _STATE_FULL]
         self._attr_translation_key = "waste_water_tank_status"
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
         try:
-            payload = None
-            
-            if isinstance(info, dict):
-                # Priority: gci > cfp
-                if 'gci' in info and isinstance(info['gci'], dict):
-                    payload = info['gci']
-                elif 'cfp' in info and isinstance(info['cfp'], dict):
-                    payload = info['cfp']
+            payload = _pick_payload(info)
             
             if payload:
                 status = self._parse_water_tank_status(payload)
@@ -545,13 +573,13 @@ class TinecoWaterTankSensor(TinecoBaseSensor):
                     return
             
             # Default to clean if we can't determine
-            self._state = "clean"
+            self._state = _STATE_CLEAN
             
         except Exception as err:
             _LOGGER.error(f"Error parsing water tank status: {err}", exc_info=True)
-            self._state = "unknown"
+            self._state = _STATE_UNKNOWN
 
-    def _parse_water_tank_status(self, payload: Dict) -> Optional[str]:
+    def _parse_water_tank_status(self, payload: dict) -> str | None:
         """Parse waste water tank status from payload."""
         if not isinstance(payload, dict):
             return None
@@ -572,24 +600,19 @@ class TinecoWaterTankSensor(TinecoBaseSensor):
         
         # Extract e1 (waste water tank error) - currently no field found in API
         # Default to clean since we don't have a reliable field yet
-        fields = extract_values(payload, ["e1", "mdt"])
+        fields = extract_values(payload, _WASTE_KEYS)
         
         # Check e1 field if it exists (might indicate waste tank issue)
-        e1 = fields.get("e1")
-        if e1 is not None:
-            try:
-                error_code = int(e1)
-                if error_code > 0:
-                    return "full"
-            except (ValueError, TypeError):
-                pass
+        error_code = _to_int(fields.get("e1"))
+        if error_code is not None and error_code > 0:
+            return _STATE_FULL
         
-        return "clean"
+        return _STATE_CLEAN
     
     @property
     def icon(self):
         """Return the icon based on state."""
-        if self._state == "full":
+        if self._state is _STATE_FULL:
             return "mdi:water-alert"
         else:
             return "mdi:water"
@@ -601,22 +624,15 @@ class TinecoFreshWaterTankSensor(TinecoBaseSensor):
     def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant, coordinator):
         """Initialize."""
         super().__init__(config_entry, "fresh_water_tank_status", hass, coordinator)
-        self._state = "full"
+        self._state = _STATE_FULL
         self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = ["empty", "low", "full"]
+        self._attr_options = [_STATE_EMPTY, "low", _STATE_FULL]
         self._attr_translation_key = "fresh_water_tank_status"
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
         try:
-            payload = None
-            
-            if isinstance(info, dict):
-                # Priority: gci > cfp
-                if 'gci' in info and isinstance(info['gci'], dict):
-                    payload = info['gci']
-                elif 'cfp' in info and isinstance(info['cfp'], dict):
-                    payload = info['cfp']
+            payload = _pick_payload(info)
             
             if payload:
                 status = self._parse_fresh_water_status(payload)
@@ -625,13 +641,13 @@ class TinecoFreshWaterTankSensor(TinecoBaseSensor):
                     return
             
             # Default to full if we can't determine
-            self._state = "full"
+            self._state = _STATE_FULL
             
         except Exception as err:
             _LOGGER.error(f"Error parsing fresh water tank status: {err}", exc_info=True)
-            self._state = "unknown"
+            self._state = _STATE_UNKNOWN
 
-    def _parse_fresh_water_status(self, payload: Dict) -> Optional[str]:
+    def _parse_fresh_water_status(self, payload: dict) -> str | None:
         """Parse fresh water tank status from payload."""
         if not isinstance(payload, dict):
             return None
@@ -651,24 +667,18 @@ class TinecoFreshWaterTankSensor(TinecoBaseSensor):
             return result
         
         # Extract e2 (fresh water tank error code)
-        fields = extract_values(payload, ["e2"])
+        fields = extract_values(payload, _FRESH_KEYS)
         
         # Check e2 field: 64 = fresh water tank empty
-        e2 = fields.get("e2")
-        if e2 is not None:
-            try:
-                error_code = int(e2)
-                if error_code == 64:
-                    return "empty"
-            except (ValueError, TypeError):
-                pass
+        if _to_int(fields.get("e2")) == 64:
+            return _STATE_EMPTY
         
-        return "full"
+        return _STATE_FULL
     
     @property
     def icon(self):
         """Return the icon based on state."""
-        if self._state == "empty":
+        if self._state is _STATE_EMPTY:
             return "mdi:water-off"
         elif self._state == "low":
             return "mdi:water-minus"
@@ -682,22 +692,15 @@ class TinecoBrushRollerSensor(TinecoBaseSensor):
     def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant, coordinator):
         """Initialize."""
         super().__init__(config_entry, "brush_roller", hass, coordinator)
-        self._state = "normal"
+        self._state = _STATE_NORMAL
         self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = ["normal", "tangled", "stuck", "needs_cleaning"]
+        self._attr_options = [_STATE_NORMAL, _STATE_TANGLED, _STATE_STUCK, _STATE_NEEDS_CLEANING]
         self._attr_translation_key = "brush_roller"
 
-    def _update_state_from_data(self, info: Dict):
+    def _update_state_from_data(self, info: dict):
         """Update state from device info."""
         try:
-            payload = None
-
-            if isinstance(info, dict):
-                # Priority: gci > cfp
-                if 'gci' in info and isinstance(info['gci'], dict):
-                    payload = info['gci']
-                elif 'cfp' in info and isinstance(info['cfp'], dict):
-                    payload = info['cfp']
+            payload = _pick_payload(info)
 
             if payload:
                 status = self._parse_brush_roller_status(payload)
@@ -706,13 +709,13 @@ class TinecoBrushRollerSensor(TinecoBaseSensor):
                     return
 
             # Default to normal if we can't determine
-            self._state = "normal"
+            self._state = _STATE_NORMAL
 
         except Exception as err:
             _LOGGER.error(f"Error parsing brush roller status: {err}", exc_info=True)
-            self._state = "unknown"
+            self._state = _STATE_UNKNOWN
 
-    def _parse_brush_roller_status(self, payload: Dict) -> Optional[str]:
+    def _parse_brush_roller_status(self, payload: dict) -> str | None:
         """Parse brush roller status from payload."""
         if not isinstance(payload, dict):
             return None
@@ -733,36 +736,29 @@ class TinecoBrushRollerSensor(TinecoBaseSensor):
 
         # Extract brush roller related fields
         # br = brush roller status, brs = brush roller speed
-        fields = extract_values(payload, ["br", "brs", "brush_roller", "roller_status"])
+        fields = extract_values(payload, _BRUSH_KEYS)
 
         # Check br field for brush roller status
-        br = fields.get("br")
-        if br is not None:
-            try:
-                status_code = int(br)
-                # Map status codes to states
-                # 0 = normal, 1 = tangled, 2 = stuck, 3 = needs_cleaning
-                if status_code == 0:
-                    return "normal"
-                elif status_code == 1:
-                    return "tangled"
-                elif status_code == 2:
-                    return "stuck"
-                elif status_code == 3:
-                    return "needs_cleaning"
-            except (ValueError, TypeError):
-                pass
-
-        return "normal"
+        # Map status codes to states
+        # 0 = normal, 1 = tangled, 2 = stuck, 3 = needs_cleaning
+        status_code = _to_int(fields.get("br"))
+        if status_code == 1:
+            return _STATE_TANGLED
+        elif status_code == 2:
+            return _STATE_STUCK
+        elif status_code == 3:
+            return _STATE_NEEDS_CLEANING
+
+        return _STATE_NORMAL
 
     @property
     def icon(self):
         """Return the icon based on state."""
-        if self._state == "tangled":
+        if self._state is _STATE_TANGLED:
             return "mdi:alert-circle"
-        elif self._state == "stuck":
+        elif self._state is _STATE_STUCK:
             return "mdi:alert"
-        elif self._state == "needs_cleaning":
+        elif self._state is _STATE_NEEDS_CLEANING:
             return "mdi:broom"
         else:  # normal
             return "mdi:rotate-3d-variant"
@@ -1,16 +1,87 @@
 """Switch platform for Tineco integration."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import sys
+from dataclasses import dataclass
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import async_get_client_and_device
+from .mode_state import get_mode_state, send_mode_commands, update_mode_state_from_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "tineco"
 
+# Sentinel distinguishing "field absent" from a falsy payload value
+_MISSING = object()
+
+# Payload roots checked in preference order
+_PAYLOAD_ROOTS = ('gci', 'cfp')
+
+# Upper bound on a single device command round-trip, in seconds
+_COMMAND_TIMEOUT = 10
+
+
+def _field(info: dict, key: str):
+    """Return the value for key under the first payload root carrying it.
+
+    EAFP on purpose: the hot path (field present under gci) is two plain
+    dict subscripts; absent roots or non-dict payloads take the cold
+    exception path instead of paying isinstance checks on every read.
+    """
+    for root in _PAYLOAD_ROOTS:
+        try:
+            return info[root][key]
+        except (KeyError, TypeError):
+            continue
+    return _MISSING
+
+
+@dataclass(frozen=True)
+class _SwitchSpec:
+    """Static description of a switch backed by a single payload field."""
+
+    type_id: str
+    field: str
+    cmd_key: str
+    invert_read: bool
+    invert_write: bool
+    on_icon: str
+    off_icon: str
+    name: str | None = None
+    default_on: bool = False
+
+
+_SPECS = (
+    _SwitchSpec(
+        type_id="sound",
+        field="vl",
+        cmd_key="ms",
+        invert_read=False,
+        invert_write=True,  # ms = 1 mutes the device
+        on_icon="mdi:volume-high",
+        off_icon="mdi:volume-off",
+        name="Tineco Sound: Enabled",
+        default_on=True,
+    ),
+    _SwitchSpec(
+        type_id="floor_brush_light",
+        field="led",
+        cmd_key="led",
+        invert_read=True,  # led = 0 means the light is on
+        invert_write=True,
+        on_icon="mdi:lightbulb-on",
+        off_icon="mdi:lightbulb-off",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -18,471 +89,361 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switch platform from a config entry."""
+    stored = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = stored["coordinator"]
+
+    # Single-consumer command queue: burst toggles are dispatched one at a
+    # time instead of racing each other over the shared HTTP session
+    queue: asyncio.Queue = asyncio.Queue()
+    stored["cmd_queue"] = queue
+
+    async def _command_worker():
+        """Dispatch queued switch commands sequentially."""
+        while True:
+            switch = await queue.get()
+            # Snapshot the target and clear the pending flag before the
+            # send, so a toggle arriving mid-flight re-enqueues the switch
+            on = switch._target
+            switch._pending = False
+            try:
+                await switch._send_command(on=on)
+            except Exception as err:
+                _LOGGER.error("Error dispatching %s command: %s", switch.switch_type, err)
+            finally:
+                queue.task_done()
+
+    config_entry.async_create_background_task(
+        hass, _command_worker(), name="tineco_switch_commands"
+    )
 
     # Add all switches
     switches = [
-        TinecoAudioSwitch(config_entry, hass),
-        TinecoFloorBrushLightSwitch(config_entry, hass),
-        TinecoWaterOnlyModeSwitch(config_entry, hass),
+        TinecoFieldSwitch(coordinator, config_entry, hass, spec) for spec in _SPECS
     ]
+    switches.append(TinecoWaterOnlyModeSwitch(coordinator, config_entry, hass))
 
     async_add_entities(switches)
 
 
-class TinecoBaseSwitch(SwitchEntity):
+class TinecoBaseSwitch(CoordinatorEntity, SwitchEntity):
     """Base class for Tineco switches."""
 
-    def __init__(self, config_entry: ConfigEntry, switch_type: str, hass: HomeAssistant):
+    # The HA Entity bases are not slotted, so instances still carry a
+    # __dict__ for the _attr_* machinery; slotting our own attributes at
+    # least keeps that dict from growing with them
+    __slots__ = (
+        "config_entry",
+        "switch_type",
+        "_icon_on",
+        "_icon_off",
+        "_last_command_time",
+        "_device_id",
+        "_device_sn",
+        "_device_class",
+        "_target",
+        "_pending",
+        "_stored",
+        "_last_available",
+    )
+
+    _attr_should_poll = False
+
+    # Display names by switch_type, shared across config entries
+    _NAME_CACHE: dict[str, str] = {}
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, switch_type: str, hass: HomeAssistant):
         """Initialize the switch."""
+        super().__init__(coordinator)
         self.config_entry = config_entry
         self.switch_type = switch_type
         self.hass = hass
-        self._attr_should_poll = True
-        self._state = False
-        self._last_command_time = None
-        
+        # Icon pair applied by _set_state; subclasses override in __init__
+        self._icon_on = None
+        self._icon_off = None
+        self._attr_is_on = False
+        # Monotonic loop timestamp of the last sent command (0.0 = never)
+        self._last_command_time = 0.0
+        # Device coordinates, snapshotted on first command
+        self._device_id = None
+        self._device_sn = ""
+        self._device_class = ""
+        # Last requested state and whether this switch is already queued
+        self._target = False
+        self._pending = False
+        # Per-entry storage dict, resolved once in async_added_to_hass
+        self._stored = None
+        # Availability as of the last state write, for change detection
+        self._last_available = None
+
         email = config_entry.data.get("email", "")
+        # The unique_id embeds the account email and must stay per-instance
         self._attr_unique_id = f"{DOMAIN}_{email}_{switch_type}"
-        self._attr_name = f"Tineco {switch_type.replace('_', ' ').title()}"
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.config_entry.entry_id)},
-            "name": "Tineco Device",
-            "manufacturer": "Jack Whelan",
-            "model": "IoT Device",
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if entity is on."""
-        return self._state
+        name = self._NAME_CACHE.get(switch_type)
+        if name is None:
+            name = self._NAME_CACHE.setdefault(
+                switch_type, sys.intern(f"Tineco {switch_type.replace('_', ' ').title()}")
+            )
+        self._attr_name = name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name="Tineco Device",
+            manufacturer="Jack Whelan",
+            model="IoT Device",
+        )
+
+    async def async_added_to_hass(self):
+        """Resolve the per-entry storage dict once instead of per callback."""
+        await super().async_added_to_hass()
+        self._stored = self.hass.data[DOMAIN][self.config_entry.entry_id]
+
+    @callback
+    def _set_state(self, on: bool) -> None:
+        """Update the cached on/off state and matching icon attribute.
+
+        SwitchEntity serves _attr_is_on/_attr_icon directly, skipping the
+        property descriptor path on every frontend state read.
+        """
+        self._attr_is_on = on
+        if self._icon_on is not None:
+            self._attr_icon = self._icon_on if on else self._icon_off
 
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        _LOGGER.info(f"Turning on {self.switch_type}")
-        # Send control command to device
-        await self._send_command(on=True)
-        self._state = True
-        self._last_command_time = datetime.now()
+        _LOGGER.info("Turning on %s", self.switch_type)
+        # Flip state optimistically; the worker sends the actual command
+        self._set_state(True)
+        self._last_command_time = self.hass.loop.time()
         self.async_write_ha_state()
+        self._enqueue_command(True)
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
-        _LOGGER.info(f"Turning off {self.switch_type}")
-        # Send control command to device
-        await self._send_command(on=False)
-        self._state = False
-        self._last_command_time = datetime.now()
+        _LOGGER.info("Turning off %s", self.switch_type)
+        # Flip state optimistically; the worker sends the actual command
+        self._set_state(False)
+        self._last_command_time = self.hass.loop.time()
         self.async_write_ha_state()
+        self._enqueue_command(False)
+
+    @callback
+    def _enqueue_command(self, on: bool):
+        """Record the desired state and wake the dispatch worker.
+
+        Rapid retoggles only overwrite _target: the switch sits in the
+        queue at most once, so the last requested state wins and no
+        redundant HTTP round-trips are made for superseded toggles.
+        """
+        self._target = on
+        if not self._pending:
+            self._pending = True
+            self._stored["cmd_queue"].put_nowait(self)
 
     async def _send_command(self, on: bool):
         """Send command to device - override in subclasses."""
         pass
 
-    async def async_update(self):
-        """Update switch state."""
-        try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
-            if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.debug("Failed to login during update")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-            device_id = device_ctx.get("id")
-            device_class = device_ctx.get("class", "")
-            device_resource = device_ctx.get("resource", "")
-            
-            # Get device status to determine if on/off
-            status = await client.async_query_device_mode(device_id, device_class, device_resource)
-            if status:
-                # Try to determine power state from device response
-                self._state = True  # Default to on if we got data
-            
-        except Exception as err:
-            _LOGGER.debug(f"Error updating switch: {err}")
+    async def _async_get_target(self):
+        """Return the client plus cached (id, sn, class) device coordinates.
+
+        The triple is snapshotted on first use; it only changes when the
+        config entry reloads, which recreates the entities anyway.
+        """
+        client, device_ctx = await async_get_client_and_device(self.hass, self.config_entry)
+        if client is None or not device_ctx:
+            return None, None, "", ""
+        if self._device_id is None:
+            self._device_id = device_ctx.get("id")
+            self._device_sn = device_ctx.get("resource", "")
+            self._device_class = device_ctx.get("class", "")
+        return client, self._device_id, self._device_sn, self._device_class
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Skip if a command was sent recently (within 5 seconds) so the
+        # optimistic state is not overwritten by stale data
+        time_since_command = self.hass.loop.time() - self._last_command_time
+        if time_since_command < 5.0:
+            _LOGGER.debug("Skipping update - recent command sent %.1fs ago", time_since_command)
+            return
+
+        old_state = self._attr_is_on
+        if self.coordinator.data:
+            self._update_from_data(self.coordinator.data)
+        available = self.available
+        if self._attr_is_on == old_state and available == self._last_available:
+            # Nothing observable changed; skip the event-bus write
+            return
+        self._last_available = available
+        self.async_write_ha_state()
+
+    @callback
+    def _update_from_data(self, info):
+        """Refresh cached state from coordinator data - override in subclasses."""
 
 
 class TinecoDevicePowerSwitch(TinecoBaseSwitch):
     """Switch for device power control."""
 
-    def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant):
+    __slots__ = ()
+
+    # Prebuilt command payloads; the client serializes them and must not
+    # mutate them downstream
+    _CMD_ON = {"power": 1}
+    _CMD_OFF = {"power": 0}
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, hass: HomeAssistant):
         """Initialize the power switch."""
-        super().__init__(config_entry, "power", hass)
-        self._state = True  # Assume device is on by default
+        super().__init__(coordinator, config_entry, "power", hass)
+        self._icon_on = "mdi:power"
+        self._icon_off = "mdi:power-off"
+        self._set_state(True)  # Assume device is on by default
 
     async def _send_command(self, on: bool):
         """Send power command to device."""
         try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
+            client, device_id, _, _ = await self._async_get_target()
             if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.error("Failed to login for power command")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.error("No devices found for power command")
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-            device_id = device_ctx.get("id")
-            
+                _LOGGER.error("No client or device available for power command")
+                return
+
             # Send power command
-            command = {"power": 1 if on else 0}
-            result = await client.async_control_device(device_id, command)
-            
+            command = self._CMD_ON if on else self._CMD_OFF
+            async with asyncio.timeout(_COMMAND_TIMEOUT):
+                result = await client.async_control_device(device_id, command)
+
             if result:
-                _LOGGER.info(f"Power command sent: {on}")
+                _LOGGER.info("Power command sent: %s", on)
             else:
                 _LOGGER.error("Failed to send power command")
-                
-        except Exception as err:
-            _LOGGER.error(f"Error sending power command: {err}")
-
-    @property
-    def icon(self):
-        """Return the icon."""
-        return "mdi:power" if self._state else "mdi:power-off"
 
-
-class TinecoAudioSwitch(TinecoBaseSwitch):
-    """Switch for sound control."""
-
-    def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant):
-        """Initialize the sound switch."""
-        super().__init__(config_entry, "sound", hass)
-        self._state = True  # Assume sound is on by default
-        # Override name with group prefix
-        self._attr_name = "Tineco Sound: Enabled"
+        except TimeoutError:
+            _LOGGER.warning("Power command timed out after %ss", _COMMAND_TIMEOUT)
+        except (OSError, KeyError, ValueError, TypeError) as err:
+            _LOGGER.error("Error sending power command: %s", err)
+
+
+class TinecoFieldSwitch(TinecoBaseSwitch):
+    """Switch whose behavior is described entirely by a _SwitchSpec."""
+
+    __slots__ = ("_spec", "_cmd_on", "_cmd_off")
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, hass: HomeAssistant, spec: _SwitchSpec):
+        """Initialize the switch from its spec."""
+        super().__init__(coordinator, config_entry, spec.type_id, hass)
+        self._spec = spec
+        self._icon_on = spec.on_icon
+        self._icon_off = spec.off_icon
+        # Prebuilt command payloads; the client serializes them and must
+        # not mutate them downstream
+        on_val, off_val = (0, 1) if spec.invert_write else (1, 0)
+        self._cmd_on = {spec.cmd_key: on_val}
+        self._cmd_off = {spec.cmd_key: off_val}
+        self._set_state(spec.default_on)
+        if spec.name:
+            # Override name with group prefix
+            self._attr_name = spec.name
 
     async def _send_command(self, on: bool):
-        """Send volume command to device."""
+        """Send the spec's command key to the device."""
+        spec = self._spec
         try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
+            client, device_id, device_sn, device_class = await self._async_get_target()
             if client is None:
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.error("Failed to login for sound command")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.error("No devices found for sound command")
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-            device_id = device_ctx.get("id")
-            device_sn = device_ctx.get("resource", "")
-            device_class = device_ctx.get("class", "")
-            
-            # Send sound command: ms = 1 to mute (off), ms = 0 to unmute (on)
-            command = {"ms": 1 if not on else 0}
-            _LOGGER.info(f"Sending sound command to device {device_id} (class: {device_class}, sn: {device_sn}): {command} (turning {'on' if on else 'off'})")
-            result = await client.async_control_device(device_id, command, device_sn, device_class)
-            
-            if result:
-                _LOGGER.info(f"Sound command sent successfully: {on}, result: {result}")
-            else:
-                _LOGGER.error("Failed to send sound command - no result returned")
-                
-        except Exception as err:
-            _LOGGER.error(f"Error sending volume command: {err}")
+                _LOGGER.error("No client or device available for %s command", spec.type_id)
+                return
 
-    async def async_update(self):
-        """Update sound switch state."""
-        try:
-            # Skip update if a command was sent recently (within 5 seconds)
-            # This prevents stale data from overwriting the optimistic state
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
-            
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            coordinator = stored.get("coordinator")
-            
-            if coordinator and coordinator.data:
-                # Get current sound state from coordinator data
-                info = coordinator.data
-                
-                # Check gci or cfp for vl (voice level) field
-                payload = None
-                if isinstance(info, dict):
-                    if 'gci' in info and isinstance(info['gci'], dict):
-                        payload = info['gci']
-                    elif 'cfp' in info and isinstance(info['cfp'], dict):
-                        payload = info['cfp']
-                
-                if payload and 'vl' in payload:
-                    # vl = 1 means sound on, vl = 0 means sound off/muted
-                    self._state = payload['vl'] >= 1
-                    
-        except Exception as err:
-            _LOGGER.debug(f"Error updating sound switch: {err}")
-
-    @property
-    def icon(self):
-        """Return the icon."""
-        return "mdi:volume-high" if self._state else "mdi:volume-off"
-
-
-class TinecoFloorBrushLightSwitch(TinecoBaseSwitch):
-    """Switch for floor brush light control."""
-
-    def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant):
-        """Initialize the floor brush light switch."""
-        super().__init__(config_entry, "floor_brush_light", hass)
-        self._state = False  # Assume light is off by default
+            command = self._cmd_on if on else self._cmd_off
+            _LOGGER.info("Sending %s command %s to device %s", spec.type_id, command, device_id)
 
-    async def _send_command(self, on: bool):
-        """Send floor brush light command to device."""
-        _LOGGER.info(f"🔧 Floor Brush Light: Attempting to turn {'ON' if on else 'OFF'}")
-        try:
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            client = stored.get("client")
-            if client is None:
-                _LOGGER.warning("Floor Brush Light: Client not found, creating new client")
-                from .client import TinecoDeviceClient
-                email = self.config_entry.data.get("email")
-                password = self.config_entry.data.get("password")
-                client = TinecoDeviceClient(email, password)
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["client"] = client
-                if not await client.async_login():
-                    _LOGGER.error("Floor Brush Light: Failed to login")
-                    return
-
-            device_ctx = stored.get("device")
-            if not device_ctx:
-                _LOGGER.warning("Floor Brush Light: Device context not found, fetching devices")
-                devices = await client.async_get_devices()
-                if not devices or not client.devices:
-                    _LOGGER.error("Floor Brush Light: No devices found")
-                    return
-                first = client.devices[0]
-                device_ctx = {
-                    "id": first.get("did") or first.get("deviceId"),
-                    "class": first.get("className", ""),
-                    "resource": first.get("resource", ""),
-                }
-                self.hass.data[DOMAIN][self.config_entry.entry_id]["device"] = device_ctx
-
-            device_id = device_ctx.get("id")
-            device_sn = device_ctx.get("resource", "")
-            device_class = device_ctx.get("class", "")
-
-            _LOGGER.info(f"Floor Brush Light: Device context - ID: {device_id}, SN: {device_sn}, Class: {device_class}")
-
-            # Send floor brush light command: led = 0 for on, led = 1 for off (inverted)
-            command = {"led": 0 if on else 1}
-            _LOGGER.info(f"Floor Brush Light: Sending command {command} to device {device_id}")
-
-            result = await client.async_control_device(device_id, command, device_sn, device_class)
+            async with asyncio.timeout(_COMMAND_TIMEOUT):
+                result = await client.async_control_device(device_id, command, device_sn, device_class)
 
             if result:
-                _LOGGER.info(f"✅ Floor Brush Light: Command sent successfully! State: {'ON' if on else 'OFF'}")
-                _LOGGER.debug(f"Floor Brush Light: Full response: {result}")
-                self._state = on
-                self._last_command_time = datetime.now()
-                self.async_write_ha_state()
+                _LOGGER.debug("%s command sent successfully: %s, result: %s", spec.type_id, on, result)
             else:
-                _LOGGER.error("❌ Floor Brush Light: Command failed - no result returned")
-                _LOGGER.info("Floor Brush Light: Checking coordinator data for current 'led' field...")
-
-                # Try to read current state to verify field exists
-                coordinator = stored.get("coordinator")
-                if coordinator and coordinator.data:
-                    info = coordinator.data
-                    _LOGGER.debug(f"Floor Brush Light: Available endpoints in coordinator data: {list(info.keys())}")
-
-                    for endpoint in ['gci', 'cfp']:
-                        if endpoint in info and isinstance(info[endpoint], dict):
-                            if 'led' in info[endpoint]:
-                                _LOGGER.info(f"Floor Brush Light: Found 'led' field in {endpoint}: {info[endpoint]['led']}")
-                            else:
-                                _LOGGER.warning(f"Floor Brush Light: 'led' field NOT found in {endpoint}")
-                                _LOGGER.debug(f"Floor Brush Light: Available fields in {endpoint}: {list(info[endpoint].keys())}")
-
-        except Exception as err:
-            _LOGGER.error(f"❌ Floor Brush Light: Exception occurred - {err}", exc_info=True)
-
-    async def async_update(self):
-        """Update floor brush light switch state."""
+                _LOGGER.error("Failed to send %s command - no result returned", spec.type_id)
+                if _LOGGER.isEnabledFor(logging.DEBUG) and self.coordinator.data:
+                    _LOGGER.debug(
+                        "%s: current %r payload value: %r",
+                        spec.type_id, spec.field, _field(self.coordinator.data, spec.field),
+                    )
+
+        except TimeoutError:
+            _LOGGER.warning("%s command timed out after %ss", spec.type_id, _COMMAND_TIMEOUT)
+        except (OSError, KeyError, ValueError, TypeError) as err:
+            _LOGGER.error("Error sending %s command: %s", spec.type_id, err)
+
+    @callback
+    def _update_from_data(self, info):
+        """Read the switch state from the spec's payload field."""
+        spec = self._spec
+        value = _field(info, spec.field)
+        if value is _MISSING:
+            return
         try:
-            # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Floor Brush Light: Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
-
-            stored = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {})
-            coordinator = stored.get("coordinator")
-
-            if coordinator and coordinator.data:
-                # Get current floor brush light state from coordinator data
-                info = coordinator.data
-                _LOGGER.debug("Floor Brush Light: Updating state from coordinator data")
-
-                # Check gci or cfp for led (floor brush light) field
-                payload = None
-                payload_source = None
-                if isinstance(info, dict):
-                    if 'gci' in info and isinstance(info['gci'], dict):
-                        payload = info['gci']
-                        payload_source = "gci"
-                    elif 'cfp' in info and isinstance(info['cfp'], dict):
-                        payload = info['cfp']
-                        payload_source = "cfp"
-
-                if payload:
-                    if 'led' in payload:
-                        # led = 0 means light on, led = 1 means light off (inverted)
-                        old_state = self._state
-                        self._state = payload['led'] == 0
-                        _LOGGER.debug(f"Floor Brush Light: State from {payload_source}.led: {payload['led']} → {'ON' if self._state else 'OFF'}")
-                        if old_state != self._state:
-                            _LOGGER.info(f"Floor Brush Light: State changed from {'ON' if old_state else 'OFF'} to {'ON' if self._state else 'OFF'}")
-                    else:
-                        _LOGGER.debug(f"Floor Brush Light: 'led' field not found in {payload_source}")
-                        _LOGGER.debug(f"Floor Brush Light: Available fields in {payload_source}: {list(payload.keys())[:20]}")
-                else:
-                    _LOGGER.debug("Floor Brush Light: No valid payload found in coordinator data")
-            else:
-                _LOGGER.debug("Floor Brush Light: No coordinator data available")
-
-        except Exception as err:
-            _LOGGER.error(f"Floor Brush Light: Error updating switch: {err}", exc_info=True)
-
-    @property
-    def icon(self):
-        """Return the icon."""
-        return "mdi:lightbulb-on" if self._state else "mdi:lightbulb-off"
+            value = int(value)
+        except (TypeError, ValueError):
+            # Malformed payload field; keep the last known state
+            return
+        self._set_state(value == 0 if spec.invert_read else value >= 1)
 
 
 class TinecoWaterOnlyModeSwitch(TinecoBaseSwitch):
     """Switch for water only mode control."""
 
-    def __init__(self, config_entry: ConfigEntry, hass: HomeAssistant):
+    __slots__ = ()
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, hass: HomeAssistant):
         """Initialize the water only mode switch."""
-        super().__init__(config_entry, "water_only_mode", hass)
-        self._state = False  # Assume water only mode is off by default
+        super().__init__(coordinator, config_entry, "water_only_mode", hass)
+        self._icon_on = "mdi:water"
+        self._icon_off = "mdi:water-off"
+        self._set_state(False)  # Assume water only mode is off by default
         # Override name with group prefix
         self._attr_name = "Tineco Water Mode: Enabled"
 
     async def _send_command(self, on: bool):
         """Send water only mode command using coordinated mode commands."""
-        _LOGGER.info(f"Setting water only mode to {'ON' if on else 'OFF'}")
+        _LOGGER.info("Setting water only mode to %s", "ON" if on else "OFF")
         try:
-            # Import get_mode_state and send_mode_commands from select module
-            from .select import get_mode_state, send_mode_commands
-
             # Update shared mode state
             mode_state = get_mode_state(self.hass, self.config_entry)
             mode_state["water_only_mode"] = on
 
-            # Send all mode commands in sequence
-            result = await send_mode_commands(self.hass, self.config_entry)
+            # Only the water mode slot changed; skip rewriting the others
+            result = await send_mode_commands(self.hass, self.config_entry, changed=("water",))
 
             if result:
-                _LOGGER.info(f"Water only mode command sent successfully: {'ON' if on else 'OFF'}")
-                self._state = on
-                self._last_command_time = datetime.now()
+                _LOGGER.info("Water only mode command sent successfully: %s", "ON" if on else "OFF")
+                self._set_state(on)
+                self._last_command_time = self.hass.loop.time()
                 self.async_write_ha_state()
-                
+
                 # Immediately notify water mode entities to update their availability
-                await self._update_water_mode_entities()
+                self._update_water_mode_entities()
             else:
                 _LOGGER.error("Failed to send water only mode command")
 
-        except Exception as err:
-            _LOGGER.error(f"Error sending water only mode command: {err}")
+        except (OSError, TimeoutError, KeyError, ValueError, TypeError) as err:
+            _LOGGER.error("Error sending water only mode command: %s", err)
 
-    async def _update_water_mode_entities(self):
+    @callback
+    def _update_water_mode_entities(self):
         """Trigger immediate update of water mode dependent entities."""
-        try:
-            # Fire an event to trigger entity updates
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_water_mode_changed",
-                {"entry_id": self.config_entry.entry_id}
-            )
-            _LOGGER.debug("Fired water mode changed event")
-        except Exception as err:
-            _LOGGER.debug(f"Error firing water mode event: {err}")
-
-    async def async_update(self):
-        """Update water only mode switch state."""
-        try:
-            # Skip update if a command was sent recently (within 5 seconds)
-            if self._last_command_time:
-                time_since_command = datetime.now() - self._last_command_time
-                if time_since_command < timedelta(seconds=5):
-                    _LOGGER.debug(f"Skipping update - recent command sent {time_since_command.total_seconds():.1f}s ago")
-                    return
-
-            # Import functions from select module
-            from .select import get_mode_state, update_mode_state_from_coordinator
-
-            # Sync shared mode state with device state
-            update_mode_state_from_coordinator(self.hass, self.config_entry)
-
-            # Update from shared mode state which is synchronized with device
-            mode_state = get_mode_state(self.hass, self.config_entry)
-            self._state = mode_state.get("water_only_mode", False)
-
-        except Exception as err:
-            _LOGGER.debug(f"Error updating water only mode switch: {err}")
-
-    @property
-    def icon(self):
-        """Return the icon."""
-        return "mdi:water" if self._state else "mdi:water-off"
+        # Dispatcher signals only wake our own listeners, unlike bus events
+        # which fan out to every subscriber on the event bus
+        async_dispatcher_send(
+            self.hass, f"{DOMAIN}_water_mode_{self.config_entry.entry_id}"
+        )
+        _LOGGER.debug("Sent water mode changed signal")
+
+    @callback
+    def _update_from_data(self, info):
+        """Sync state from the shared mode state."""
+        # Sync shared mode state with device state
+        update_mode_state_from_coordinator(self.hass, self.config_entry)
+
+        # Update from shared mode state which is synchronized with device
+        mode_state = get_mode_state(self.hass, self.config_entry)
+        self._set_state(mode_state.get("water_only_mode", False))
@@ -1,16 +1,41 @@
 """
 Tineco IoT API Client Implementation.
 """
+import concurrent.futures
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
+import secrets
+import threading
 import time
 import uuid
 from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine without it
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound once so the signing paths skip the per-call attribute lookup
+_time_ns = time.time_ns
+
+
+def _json_loads(response):
+    """Decode a requests.Response body, via orjson when available.
+
+    orjson parses in C and takes the raw bytes directly, skipping the
+    UTF-8 str detour that Response.json() goes through.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class TinecoNewDeviceException(Exception):
     """Exception raised when new device verification is required."""
@@ -29,6 +54,20 @@ class TinecoClient:
     AUTH_APPKEY_AUTHCODE = "1538103661113"
     APP_SECRET_AUTHCODE = "197472fcef3935ebc330657266992b99"
 
+    # Refresh cached authCode/IoT tokens after this many seconds; the
+    # backend tokens typically live an hour, so renew a little early
+    TOKEN_TTL = 3300
+
+    # How long a complete-device-info snapshot stays fresh; long enough to
+    # absorb back-to-back calls, short enough that polls still see changes
+    INFO_CACHE_TTL = 1.0
+
+    # Pre-encoded signing constants so _auth_sign never re-encodes them
+    _AUTH_APPKEY_B = AUTH_APPKEY.encode('utf-8')
+    _APP_SECRET_B = APP_SECRET.encode('utf-8')
+    _AUTH_APPKEY_AUTHCODE_B = AUTH_APPKEY_AUTHCODE.encode('utf-8')
+    _APP_SECRET_AUTHCODE_B = APP_SECRET_AUTHCODE.encode('utf-8')
+
     # Region to timezone mapping
     REGION_TIMEZONE_MAP = {
         "IE": "Europe/London",
@@ -61,30 +100,125 @@ class TinecoClient:
         self.iot_resource = ""
         self.device_list = []
 
+        # Monotonic deadlines after which the cached credentials are
+        # treated as stale and re-fetched instead of failing mid-request
+        self._auth_code_expires_at = 0.0
+        self._iot_token_expires_at = 0.0
+
+        # device_id -> (fetch time, info) snapshots for get_complete_device_info
+        self._info_cache = {}
+
+        # Background device-list prefetch started on login success and
+        # joined by get_devices()
+        self._devices_prefetch = None
+        self._prefetched_devices = None
+
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "okhttp/3.12.0",
             "Connection": "Keep-Alive"
         })
+        # Tuned connection pool so concurrent queries (get_complete_device_info
+        # fans out over five threads) reuse keep-alive connections instead of
+        # serialising new TLS handshakes, plus a small retry budget for
+        # transient gateway errors.
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2,
+                              status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
         self.IOT_API_BASE = "https://api-ngiot.dc-eu.ww.ecouser.net/api/iot/endpoint/control"
         self.IOT_LOGIN_ENDPOINT = "https://api-base.dc-eu.ww.ecouser.net/api/users/user.do"
 
+        # URL prefixes are fixed once region/language are known, so build
+        # them here instead of re-interpolating on every request
+        region_lower = region.lower()
+        self._private_api_base = (f"https://qas-gl-{region_lower}-api.tineco.com/v1/private/"
+                                  f"{self.region}/{self.language}/{self.DEVICE_ID}/global_e/"
+                                  f"{self.APP_VERSION}/{self.STORE}/1")
+        self._login_url = f"{self._private_api_base}/user/login"
+        self._authcode_url = (f"https://qas-gl-{region_lower}-openapi.tineco.com/v1/"
+                              f"global/auth/getAuthCode")
+        self._devlist_url = (f"https://qas-gl-{region_lower}-openapi.tineco.com/v1/"
+                             f"global/device/getDeviceListV2")
+
+        # Auth-sign parameters that never change for the lifetime of the
+        # client, pre-encoded once; per-call values are merged in by
+        # _auth_sign(). One set for the private API, one for the openapi
+        # (authCode / device list) endpoints.
+        self._const_auth_parts = [
+            f"authTimeZone={self.AUTH_TIMEZONE}".encode('utf-8'),
+            f"country={self.region}".encode('utf-8'),
+            f"lang={self.language}".encode('utf-8'),
+            b"appCode=global_e",
+            f"appVersion={self.APP_VERSION}".encode('utf-8'),
+            f"deviceId={self.DEVICE_ID}".encode('utf-8'),
+            f"channel={self.STORE}".encode('utf-8'),
+            b"deviceType=1",
+        ]
+        self._const_openapi_parts = [
+            b"appCode=global_e",
+            f"appVersion={self.APP_VERSION}".encode('utf-8'),
+            b"openId=global",
+            f"deviceId={self.DEVICE_ID}".encode('utf-8'),
+        ]
+
+    @staticmethod
+    def _new_session_id() -> str:
+        """Return a 16-char hex session ID for IoT requests."""
+        return secrets.token_hex(8)
+
     @staticmethod
     def generate_valid_device_id():
         """Generates a random device ID in MD5 format (32 hex chars)."""
         random_uuid = uuid.uuid4().hex
         return hashlib.md5(random_uuid.encode('utf-8')).hexdigest()
 
-    def _md5_hash(self, text: str) -> str:
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+    def _md5_hash(self, text) -> str:
+        """MD5 hex digest of a str or bytes value (API signing, not security)."""
+        data = text if isinstance(text, bytes) else text.encode('utf-8')
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+    def _auth_sign(self, appkey: bytes, secret: bytes, const_parts, extra_parts) -> str:
+        """Compute the request signature over sorted parameter fragments.
+
+        const_parts are the pre-encoded parts built in __init__; extra_parts
+        are the per-call "key=value" strings. UTF-8 preserves code-point
+        order, so sorting the encoded parts matches the str sort the API
+        expects. The parts are streamed into the MD5 state rather than
+        concatenated - MD5 is a streaming construction, so the digest is
+        identical without allocating the joined buffer.
+        """
+        parts = list(const_parts)
+        parts += [p.encode('utf-8') for p in extra_parts]
+        parts.sort()
+        h = hashlib.md5(appkey, usedforsecurity=False)
+        for p in parts:
+            h.update(p)
+        h.update(secret)
+        return h.hexdigest()
 
     def _process_login_success(self, data_json):
         d = data_json.get("data", data_json)
         self.access_token = d.get("accessToken", "")
         self.uid = d.get("uid", "")
         _LOGGER.info(f"Login successful! UID: {self.uid}")
+        # Every caller's next step is get_devices(), so start fetching the
+        # list now; get_devices() joins this thread instead of re-requesting
+        self._devices_prefetch = threading.Thread(
+            target=self._prefetch_devices, daemon=True)
+        self._devices_prefetch.start()
         return True, self.access_token, self.uid
 
+    def _prefetch_devices(self):
+        """Background device-list fetch kicked off by a successful login."""
+        try:
+            self._prefetched_devices = self._fetch_devices()
+        except Exception as e:
+            _LOGGER.debug("Device prefetch failed: %s", e)
+
     def login(self, email: str, password: str, request_code: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Login method.
@@ -92,31 +226,18 @@ class TinecoClient:
         request_code=False -> Just logs error (Background mode).
         """
         try:
-            timestamp = int(time.time() * 1000)
+            timestamp = _time_ns() // 1_000_000
             password_md5 = self._md5_hash(password)
 
-            sign_params = [
+            auth_sign = self._auth_sign(self._AUTH_APPKEY_B, self._APP_SECRET_B, self._const_auth_parts, [
                 f"authTimespan={timestamp}",
-                f"authTimeZone={self.AUTH_TIMEZONE}",
-                f"country={self.region}",
-                f"lang={self.language}",
-                "appCode=global_e",
-                f"appVersion={self.APP_VERSION}",
-                f"deviceId={self.DEVICE_ID}",
-                f"channel={self.STORE}",
-                "deviceType=1",
                 "uid=",
                 "accessToken=",
                 f"account={email}",
                 f"password={password_md5}"
-            ]
-            sign_params.sort()
-            auth_string = self.AUTH_APPKEY + "".join(sign_params) + self.APP_SECRET
-            auth_sign = self._md5_hash(auth_string)
+            ])
 
-            base_url = (f"https://qas-gl-{self.region.lower()}-api.tineco.com/v1/private/"
-                        f"{self.region}/{self.language}/{self.DEVICE_ID}/global_e/"
-                        f"{self.APP_VERSION}/{self.STORE}/1/user/login")
+            base_url = self._login_url
 
             query_params = {
                 "authAppkey": self.AUTH_APPKEY, "authSign": auth_sign,
@@ -137,7 +258,7 @@ class TinecoClient:
             response = self.session.get(full_url, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response)
                 code = str(data.get("code"))
 
                 if code == "0000":
@@ -171,24 +292,15 @@ class TinecoClient:
     def send_email_verify_code(self, email: str) -> Optional[str]:
         """Requests code and returns verifyId"""
         endpoint = "/user/sendEmailVerifyCode"
-        timestamp = int(time.time() * 1000)
+        timestamp = _time_ns() // 1_000_000
         request_id = uuid.uuid4().hex
 
-        sign_params = [
-            f"authTimespan={timestamp}", f"authTimeZone={self.AUTH_TIMEZONE}",
-            f"country={self.region}", f"lang={self.language}",
-            "appCode=global_e", f"appVersion={self.APP_VERSION}",
-            f"deviceId={self.DEVICE_ID}", f"channel={self.STORE}",
-            "deviceType=1", f"requestId={request_id}",
+        auth_sign = self._auth_sign(self._AUTH_APPKEY_B, self._APP_SECRET_B, self._const_auth_parts, [
+            f"authTimespan={timestamp}", f"requestId={request_id}",
             f"email={email}", "verifyType=EMAIL_NEW_DEVICE"
-        ]
-        sign_params.sort()
-        auth_string = self.AUTH_APPKEY + "".join(sign_params) + self.APP_SECRET
-        auth_sign = self._md5_hash(auth_string)
+        ])
 
-        base_url = (f"https://qas-gl-{self.region.lower()}-api.tineco.com/v1/private/"
-                    f"{self.region}/{self.language}/{self.DEVICE_ID}/global_e/"
-                    f"{self.APP_VERSION}/{self.STORE}/1{endpoint}")
+        base_url = f"{self._private_api_base}{endpoint}"
 
         query_params = {
             "authAppkey": self.AUTH_APPKEY, "authSign": auth_sign,
@@ -207,7 +319,7 @@ class TinecoClient:
 
         try:
             resp = self.session.get(full_url)
-            js = resp.json()
+            js = _json_loads(resp)
             if str(js.get("code")) == "0000":
                 v_id = js.get("data", {}).get("verifyId")
                 _LOGGER.debug(f"Code sent. VerifyID: {v_id}")
@@ -223,24 +335,15 @@ class TinecoClient:
         bool, Optional[str], Optional[str]]:
         """Finalize login with OTP."""
         endpoint = "/user/quickLoginByEmail"
-        timestamp = int(time.time() * 1000)
+        timestamp = _time_ns() // 1_000_000
         request_id = uuid.uuid4().hex
 
-        sign_params = [
-            f"authTimespan={timestamp}", f"authTimeZone={self.AUTH_TIMEZONE}",
-            f"country={self.region}", f"lang={self.language}",
-            "appCode=global_e", f"appVersion={self.APP_VERSION}",
-            f"deviceId={self.DEVICE_ID}", f"channel={self.STORE}",
-            "deviceType=1", f"requestId={request_id}",
+        auth_sign = self._auth_sign(self._AUTH_APPKEY_B, self._APP_SECRET_B, self._const_auth_parts, [
+            f"authTimespan={timestamp}", f"requestId={request_id}",
             f"email={email}", f"verifyId={verify_id}", f"verifyCode={verify_code}"
-        ]
-        sign_params.sort()
-        auth_string = self.AUTH_APPKEY + "".join(sign_params) + self.APP_SECRET
-        auth_sign = self._md5_hash(auth_string)
+        ])
 
-        base_url = (f"https://qas-gl-{self.region.lower()}-api.tineco.com/v1/private/"
-                    f"{self.region}/{self.language}/{self.DEVICE_ID}/global_e/"
-                    f"{self.APP_VERSION}/{self.STORE}/1{endpoint}")
+        base_url = f"{self._private_api_base}{endpoint}"
 
         query_params = {
             "authAppkey": self.AUTH_APPKEY, "authSign": auth_sign,
@@ -262,7 +365,7 @@ class TinecoClient:
 
         try:
             resp = self.session.get(full_url)
-            js = resp.json()
+            js = _json_loads(resp)
             if str(js.get("code")) == "0000":
                 return self._process_login_success(js)
             else:
@@ -272,39 +375,24 @@ class TinecoClient:
             _LOGGER.error(f"Network error in quick_login_by_email: {e}")
             return False, None, None
 
-    def _process_login_success(self, data_json):
-        """Helper function to extract data after success"""
-        d = data_json.get("data", data_json)
-        self.access_token = d.get("accessToken", "")
-        self.uid = d.get("uid", "")
-        print(f"[SUCCESS] Logged in! UID: {self.uid}")
-        return True, self.access_token, self.uid
-
     def _get_auth_code(self) -> bool:
         """Get authCode from /global/auth/getAuthCode endpoint"""
         if not self.uid or not self.access_token:
-            print("[ERROR] REST login required before getting authCode")
+            _LOGGER.error("REST login required before getting authCode")
             return False
 
         try:
-            url = (f"https://qas-gl-{self.region.lower()}-openapi.tineco.com/v1/"
-                   f"global/auth/getAuthCode")
+            url = self._authcode_url
 
-            timestamp = int(time.time() * 1000)
+            timestamp = _time_ns() // 1_000_000
 
-            params_list = [
-                f"authTimespan={timestamp}",
-                "appCode=global_e",
-                f"appVersion={self.APP_VERSION}",
-                "openId=global",
-                f"uid={self.uid}",
-                f"accessToken={self.access_token}",
-                f"deviceId={self.DEVICE_ID}"
-            ]
-
-            params_list.sort()
-            auth_string = self.AUTH_APPKEY_AUTHCODE + "".join(params_list) + self.APP_SECRET_AUTHCODE
-            auth_sign = self._md5_hash(auth_string)
+            auth_sign = self._auth_sign(
+                self._AUTH_APPKEY_AUTHCODE_B, self._APP_SECRET_AUTHCODE_B,
+                self._const_openapi_parts, [
+                    f"authTimespan={timestamp}",
+                    f"uid={self.uid}",
+                    f"accessToken={self.access_token}"
+                ])
 
             query_params = {
                 "authAppkey": self.AUTH_APPKEY_AUTHCODE,
@@ -317,14 +405,14 @@ class TinecoClient:
                 "authTimespan": timestamp
             }
 
-            print("[INFO] Getting authCode...")
+            _LOGGER.debug("Getting authCode...")
             response = self.session.get(url, params=query_params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response)
                 code = data.get("code")
 
-                if code == "0000" or code == 0:
+                if code in ("0000", 0):
                     auth_code_data = data.get("data", data)
                     if isinstance(auth_code_data, dict):
                         self.auth_code = auth_code_data.get("authCode", "")
@@ -332,31 +420,30 @@ class TinecoClient:
                         self.auth_code = auth_code_data if isinstance(auth_code_data, str) else ""
 
                     if not self.auth_code:
-                        print("[ERROR] authCode not in response")
+                        _LOGGER.error("authCode not in response")
                         return False
 
-                    print("[OK] Got authCode!")
-                    print(f"    authCode: {self.auth_code[:20]}...")
+                    self._auth_code_expires_at = time.monotonic() + self.TOKEN_TTL
+                    _LOGGER.debug("Got authCode: %.20s...", self.auth_code)
                     return True
                 else:
-                    print(f"[ERROR] Failed to get authCode: {data.get('msg', 'Unknown error')}")
+                    _LOGGER.error("Failed to get authCode: %s", data.get('msg', 'Unknown error'))
                     return False
             else:
-                print(f"[ERROR] HTTP Error: {response.status_code}")
+                _LOGGER.error("HTTP Error: %s", response.status_code)
                 return False
 
         except Exception as e:
-            print(f"[ERROR] Error getting authCode: {str(e)}")
+            _LOGGER.error("Error getting authCode: %s", e)
             return False
 
     def _iot_login(self) -> bool:
         """Login to IoT service to get token and resource for device list API"""
         if not self.uid or not self.auth_code:
-            print("[ERROR] REST login and authCode required before IoT login")
+            _LOGGER.error("REST login and authCode required before IoT login")
             return False
 
         try:
-            import uuid
             device_uuid = str(uuid.uuid4())
 
             payload = {
@@ -371,11 +458,11 @@ class TinecoClient:
                 "org": "TEKWW"
             }
 
-            print("[INFO] Performing IoT login...")
+            _LOGGER.debug("Performing IoT login...")
             response = self.session.post(self.IOT_LOGIN_ENDPOINT, json=payload, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response)
                 result = data.get("result", "")
 
                 if result == "ok":
@@ -385,65 +472,72 @@ class TinecoClient:
                     if "userId" in data:
                         self.uid = data.get("userId")
 
-                    print("[OK] IoT login successful!")
-                    print(f"    IoT Token: {self.iot_token[:20]}...")
-                    print(f"    IoT Resource: {self.iot_resource}")
+                    self._iot_token_expires_at = time.monotonic() + self.TOKEN_TTL
+                    _LOGGER.debug("IoT login successful (resource %s)", self.iot_resource)
                     return True
                 else:
                     error = data.get("error", "Unknown error")
-                    print(f"[ERROR] IoT login failed: {error}")
+                    _LOGGER.error("IoT login failed: %s", error)
                     return False
             else:
-                print(f"[ERROR] IoT login HTTP error: {response.status_code}")
+                _LOGGER.error("IoT login HTTP error: %s", response.status_code)
                 return False
 
         except Exception as e:
-            print(f"[ERROR] IoT login error: {str(e)}")
+            _LOGGER.error("IoT login error: %s", e)
             return False
 
     def get_devices(self) -> Optional[Dict]:
         """Get list of devices for the logged-in user"""
+        prefetch = self._devices_prefetch
+        if prefetch is not None:
+            prefetch.join()
+            self._devices_prefetch = None
+            result = self._prefetched_devices
+            self._prefetched_devices = None
+            if result is not None:
+                return result
+
+        return self._fetch_devices()
+
+    def _fetch_devices(self) -> Optional[Dict]:
+        """Fetch the device list from the API (see get_devices)."""
         if not self.access_token or not self.uid:
-            print("[ERROR] Not logged in. Call login() first.")
+            _LOGGER.error("Not logged in. Call login() first.")
             return None
 
-        if not self.auth_code:
-            print("[INFO] Getting authCode for device access...")
+        now = time.monotonic()
+
+        if not self.auth_code or now >= self._auth_code_expires_at:
+            _LOGGER.debug("Getting authCode for device access...")
             if not self._get_auth_code():
-                print("[ERROR] Failed to get authCode")
+                _LOGGER.error("Failed to get authCode")
                 return None
 
-        if not self.iot_token:
-            print("[INFO] Performing IoT login to get device credentials...")
+        if not self.iot_token or now >= self._iot_token_expires_at:
+            _LOGGER.debug("Performing IoT login to get device credentials...")
             if not self._iot_login():
-                print("[ERROR] IoT login failed, cannot get device list")
+                _LOGGER.error("IoT login failed, cannot get device list")
                 return None
 
         try:
-            url = (f"https://qas-gl-{self.region.lower()}-openapi.tineco.com/v1/"
-                   f"global/device/getDeviceListV2")
-
-            timestamp = int(time.time() * 1000)
-
-            params_list = [
-                f"authTimespan={timestamp}",
-                f"lang={self.language}",
-                "appCode=global_e",
-                f"appVersion={self.APP_VERSION}",
-                f"deviceId={self.DEVICE_ID}",
-                "openId=global",
-                f"uid={self.uid}",
-                f"accessToken={self.access_token}",
-                f"resource={self.iot_resource}",
-                f"token={self.iot_token}",
-                f"userId={self.uid}",
-                "deviceType=1",
-                "refresh=false"
-            ]
-
-            params_list.sort()
-            auth_string = self.AUTH_APPKEY_AUTHCODE + "".join(params_list) + self.APP_SECRET_AUTHCODE
-            auth_sign = self._md5_hash(auth_string)
+            url = self._devlist_url
+
+            timestamp = _time_ns() // 1_000_000
+
+            auth_sign = self._auth_sign(
+                self._AUTH_APPKEY_AUTHCODE_B, self._APP_SECRET_AUTHCODE_B,
+                self._const_openapi_parts, [
+                    f"authTimespan={timestamp}",
+                    f"lang={self.language}",
+                    f"uid={self.uid}",
+                    f"accessToken={self.access_token}",
+                    f"resource={self.iot_resource}",
+                    f"token={self.iot_token}",
+                    f"userId={self.uid}",
+                    "deviceType=1",
+                    "refresh=false"
+                ])
 
             query_params = {
                 "authAppkey": self.AUTH_APPKEY_AUTHCODE,
@@ -462,49 +556,42 @@ class TinecoClient:
                 "refresh": "false"
             }
 
-            print("[INFO] Fetching device list...")
+            _LOGGER.debug("Fetching device list...")
             response = self.session.get(url, params=query_params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
-                if data.get("code") == "0000" or data.get("code") == 0:
+                data = _json_loads(response)
+                code = data.get("code")
+                if code in ("0000", 0):
                     payload = data.get("payload", data.get("data", data))
                     if isinstance(payload, dict):
                         self.device_list = payload.get("deviceList", payload.get("userDeviceList", []))
                     else:
                         self.device_list = payload if isinstance(payload, list) else []
 
-                    print(f"[OK] Found {len(self.device_list)} device(s)")
-                    for device in self.device_list:
-                        device_name = device.get('deviceName', device.get('name', 'Unknown'))
-                        device_id = device.get('deviceId', device.get('id', 'Unknown'))
-                        print(f"    - {device_name} ({device_id})")
+                    _LOGGER.debug("Found %d device(s)", len(self.device_list))
                     return data
                 else:
-                    print(f"[ERROR] Failed to get devices: {data.get('msg', data.get('message', 'Unknown error'))}")
+                    _LOGGER.error("Failed to get devices: %s", data.get('msg', data.get('message', 'Unknown error')))
                     return None
             else:
-                print(f"[ERROR] HTTP Error: {response.status_code}")
+                _LOGGER.error("HTTP Error: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"[ERROR] Error getting devices: {str(e)}")
+            _LOGGER.error("Error getting devices: %s", e)
             return None
 
     def get_device_status(self, device_id: str, device_class: str = "",
                           device_resource: str = "", session_id: str = "") -> Optional[Dict]:
         """Get device status from IoT API"""
         if not self.access_token:
-            print("[ERROR] Not logged in. Call login() first.")
+            _LOGGER.error("Not logged in. Call login() first.")
             return None
 
         try:
-            import random
-            import string
-
             if not session_id:
-                chars = string.ascii_letters + string.digits
-                session_id = ''.join(random.choice(chars) for _ in range(16))
+                session_id = self._new_session_id()
 
             params = {
                 "ct": "q",
@@ -524,17 +611,17 @@ class TinecoClient:
                 "X-ECO-REQUEST-ID": session_id
             }
 
-            print(f"[INFO] Querying device {device_id}...")
+            _LOGGER.debug("Querying device %s...", device_id)
             response = self.session.post(self.IOT_API_BASE, params=params, headers=headers, timeout=10)
 
             ngiot_ret = response.headers.get("X-NGIOT-RET", "")
 
             if response.status_code == 200:
                 if ngiot_ret == "ok":
-                    print("[OK] IoT endpoint returned success")
+                    _LOGGER.debug("IoT endpoint returned success")
                     if response.text:
                         try:
-                            return response.json()
+                            return _json_loads(response)
                         except Exception:
                             return {"status": "ok", "session_id": session_id}
                     else:
@@ -542,20 +629,20 @@ class TinecoClient:
                 else:
                     if response.text:
                         try:
-                            data = response.json()
+                            data = _json_loads(response)
                             if isinstance(data, dict) and (
-                                    "code" in data and data.get("code") == "0000" or "payload" in data):
-                                print("[OK] Device status retrieved successfully")
+                                    data.get("code") == "0000" or "payload" in data):
+                                _LOGGER.debug("Device status retrieved successfully")
                                 return data
                         except Exception:
                             pass
                     return None
             else:
-                print(f"[ERROR] HTTP Error: {response.status_code}")
+                _LOGGER.error("HTTP Error: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"[ERROR] Error getting device status: {str(e)}")
+            _LOGGER.error("Error getting device status: %s", e)
             return None
 
     def _send_iot_query(self, device_id: str, action: str,
@@ -563,16 +650,12 @@ class TinecoClient:
                         session_id: str = "") -> Optional[Dict]:
         """Internal method to send IoT query actions"""
         if not self.access_token:
-            print("[ERROR] Not logged in. Call login() first.")
+            _LOGGER.error("Not logged in. Call login() first.")
             return None
 
         try:
-            import random
-            import string
-
             if not session_id:
-                chars = string.ascii_letters + string.digits
-                session_id = ''.join(random.choice(chars) for _ in range(16))
+                session_id = self._new_session_id()
 
             params = {
                 "ct": "q",
@@ -592,30 +675,30 @@ class TinecoClient:
                 "X-ECO-REQUEST-ID": session_id
             }
 
-            print(f"[INFO] Querying device with action: {action}")
+            _LOGGER.debug("Querying device with action: %s", action)
             response = self.session.post(self.IOT_API_BASE, params=params, headers=headers, timeout=10)
 
             if response.status_code == 200:
                 ngiot_ret = response.headers.get("X-NGIOT-RET", "")
 
                 if ngiot_ret == "ok":
-                    print(f"[OK] Action '{action}' successful")
+                    _LOGGER.debug("Action %r successful", action)
                     if response.text:
                         try:
-                            return response.json()
+                            return _json_loads(response)
                         except Exception:
                             return {"status": "ok", "action": action}
                     else:
                         return {"status": "ok", "action": action}
                 else:
-                    print("[ERROR] Query failed")
+                    _LOGGER.error("Query failed")
                     return None
             else:
-                print(f"[ERROR] HTTP Error: {response.status_code}")
+                _LOGGER.error("HTTP Error: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"[ERROR] Error in query: {str(e)}")
+            _LOGGER.error("Error in query: %s", e)
             return None
 
     def get_controller_info(self, device_id: str, device_class: str = "",
@@ -643,44 +726,78 @@ class TinecoClient:
         """Query device operating mode (QueryMode)"""
         return self._send_iot_query(device_id, "QueryMode", device_class, device_resource)
 
+    def wait_for_state(self, device_id: str, predicate, timeout: float = 3.0,
+                       interval: float = 0.1, device_class: str = "",
+                       device_resource: str = "") -> Optional[Dict]:
+        """Poll controller state until predicate(state) is true or timeout.
+
+        Replaces fixed post-command sleeps: gci is the cheapest endpoint, so
+        polling it returns as soon as the device reports the change instead
+        of always waiting the worst case. Returns the last state seen (which
+        satisfied the predicate unless the wait timed out), or None if no
+        state could be read at all.
+        """
+        deadline = time.monotonic() + timeout
+        state = None
+        while True:
+            polled = self.get_controller_info(device_id, device_class,
+                                              device_resource)
+            if polled is not None:
+                state = polled
+                if predicate(state):
+                    break
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+        return state
+
+    def invalidate_device_info(self, device_id: str) -> None:
+        """Drop the cached complete-device-info snapshot for device_id."""
+        self._info_cache.pop(device_id, None)
+
     def get_complete_device_info(self, device_id: str, device_class: str = "",
                                  device_resource: str = "") -> Dict:
         """Get complete device information by querying all available endpoints"""
-        print(f"\n[INFO] Retrieving complete device information for {device_id}...")
+        cached = self._info_cache.get(device_id)
+        if cached is not None:
+            cached_ts, cached_info = cached
+            if time.monotonic() - cached_ts < self.INFO_CACHE_TTL:
+                _LOGGER.debug("Returning cached device info for %s", device_id)
+                return cached_info
+
+        _LOGGER.debug("Retrieving complete device information for %s...", device_id)
 
         info = {}
 
+        # (info key, IoT action) pairs - the queries are independent, so they
+        # run concurrently instead of paying five sequential round-trips
+        queries = [
+            ('gci', 'gci'),
+            ('gav', 'gav'),
+            ('gcf', 'gcf'),
+            ('cfp', 'cfp'),
+            ('query_mode', 'QueryMode'),
+        ]
+
         try:
-            print("[INFO] Getting controller info (GCI)...")
-            gci = self.get_controller_info(device_id, device_class, device_resource)
-            if gci:
-                info['gci'] = gci
-
-            print("[INFO] Getting API version (GAV)...")
-            gav = self.get_api_version(device_id, device_class, device_resource)
-            if gav:
-                info['gav'] = gav
-
-            print("[INFO] Getting config file (GCF)...")
-            gcf = self.get_config_file(device_id, device_class, device_resource)
-            if gcf:
-                info['gcf'] = gcf
-
-            print("[INFO] Getting config point (CFP)...")
-            cfp = self.get_device_config_point(device_id, device_class, device_resource)
-            if cfp:
-                info['cfp'] = cfp
-
-            print("[INFO] Getting device modes (QueryMode)...")
-            query_mode = self.query_device_mode(device_id, device_class, device_resource)
-            if query_mode:
-                info['query_mode'] = query_mode
-
-            print(f"[OK] Retrieved {len(info)} information sources")
+            _LOGGER.debug("Querying all endpoints concurrently (gci, gav, gcf, cfp, QueryMode)")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {
+                    key: executor.submit(self._send_iot_query, device_id, action,
+                                         device_class, device_resource)
+                    for key, action in queries
+                }
+                for key, future in futures.items():
+                    result = future.result()
+                    if result:
+                        info[key] = result
+
+            _LOGGER.debug("Retrieved %d information sources", len(info))
+            self._info_cache[device_id] = (time.monotonic(), info)
             return info
 
         except Exception as e:
-            print(f"[ERROR] Error retrieving complete device info: {str(e)}")
+            _LOGGER.error("Error retrieving complete device info: %s", e)
             return info
 
     def control_device(self, device_id: str, command: Dict,
@@ -688,16 +805,16 @@ class TinecoClient:
             Optional[Dict]:
         """Send control command to device via IoT API"""
         if not self.access_token:
-            print("[ERROR] Not logged in. Call login() first.")
+            _LOGGER.error("Not logged in. Call login() first.")
             return None
 
-        try:
-            import random
-            import string
+        # The command is about to change device state, so any cached
+        # complete-device-info snapshot is stale
+        self.invalidate_device_info(device_id)
 
+        try:
             if not session_id:
-                chars = string.ascii_letters + string.digits
-                session_id = ''.join(random.choice(chars) for _ in range(16))
+                session_id = self._new_session_id()
 
             params = {
                 "ct": "q",
@@ -717,15 +834,14 @@ class TinecoClient:
                 "X-ECO-REQUEST-ID": session_id
             }
 
-            # Construct full URL for display
-            from urllib.parse import urlencode
-            full_url = f"{self.IOT_API_BASE}?{urlencode(params)}"
-            print(f"[DEBUG] URL: {full_url}")
-            print(f"[DEBUG] Body: {command}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # Construct full URL for display only when debug is on
+                _LOGGER.debug("URL: %s?%s", self.IOT_API_BASE, urlencode(params))
+                _LOGGER.debug("Body: %s", command)
 
             response = self.session.post(self.IOT_API_BASE, params=params, headers=headers, json=command, timeout=10)
 
-            print(f"[DEBUG] Response: {response.text}")
+            _LOGGER.debug("Response: %s", response.text)
 
             if response.status_code == 200:
                 ngiot_ret = response.headers.get("X-NGIOT-RET", "")
@@ -733,7 +849,7 @@ class TinecoClient:
                 if ngiot_ret == "ok":
                     if response.text and response.text.strip():
                         try:
-                            return response.json()
+                            return _json_loads(response)
                         except json.JSONDecodeError:
                             return {"status": "ok", "note": "empty json response"}
                     else:
@@ -741,25 +857,44 @@ class TinecoClient:
                 else:
                     if response.text:
                         try:
-                            data = response.json()
+                            data = _json_loads(response)
                             return data
                         except Exception:
                             pass
                     return {"status": "unknown", "ngiot_ret": ngiot_ret}
             else:
-                print(f"[ERROR] HTTP Error: {response.status_code}")
+                _LOGGER.error("HTTP Error: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"[ERROR] Error sending command: {str(e)}")
+            _LOGGER.error("Error sending command: %s", e)
             return None
 
+    def control_device_batch(self, device_id: str, commands,
+                             device_sn: str = "", device_class: str = "") -> list:
+        """Send a sequence of (payload, action) commands back to back.
+
+        The IoT endpoint takes one action per POST (the action rides in the
+        query string), so the commands cannot be folded into a single request
+        body; instead they are pipelined over the pooled keep-alive
+        connection with no artificial delay. Returns one result per command,
+        in order.
+        """
+        return [
+            self.control_device(device_id, command, device_sn, device_class,
+                                action=action)
+            for command, action in commands
+        ]
+
 
 def print_json(data, indent=2):
     """Pretty print JSON data"""
     try:
         if isinstance(data, dict):
-            print(json.dumps(data, indent=indent))
+            if orjson is not None and indent == 2:
+                print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+            else:
+                print(json.dumps(data, indent=indent))
         else:
             print(data)
     except Exception:
@@ -899,7 +1034,9 @@ def main():
     print(f"\n[OK] Retrieved information from {len(complete_info)} endpoints:")
     for key, value in complete_info.items():
         if value:
-            size = len(json.dumps(value))
+            # One serialization pass per payload, via orjson when available
+            ser = orjson.dumps(value) if orjson is not None else json.dumps(value)
+            size = len(ser)
             print(f"    [OK] {key.upper():15} - {size:,} bytes")
         else:
             print(f"    [ERROR] {key.upper():15} - Failed")
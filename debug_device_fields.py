@@ -4,8 +4,11 @@ Debug script to show all available fields from your Tineco device.
 This helps identify the correct command keys for controls.
 """
 
+import concurrent.futures
 import sys
 import json
+import threading
+from collections import deque
 from pathlib import Path
 
 # Add the custom_components directory to the path
@@ -22,23 +25,32 @@ def print_section(title):
 
 
 def explore_dict(data, prefix="", max_depth=3, current_depth=0):
-    """Recursively explore dictionary and print all keys."""
-    if current_depth >= max_depth or not isinstance(data, dict):
-        return
-
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-
-        if isinstance(value, dict):
-            print(f"  {full_key}: <dict with {len(value)} keys>")
-            explore_dict(value, full_key, max_depth, current_depth + 1)
-        elif isinstance(value, list):
-            print(f"  {full_key}: <list with {len(value)} items>")
-            if value and isinstance(value[0], dict):
-                explore_dict(value[0], f"{full_key}[0]", max_depth, current_depth + 1)
-        else:
-            # Show the value for simple types
-            print(f"  {full_key}: {value}")
+    """Iteratively explore a dictionary and print all keys."""
+    # JSON-decoded values are exactly dict/list, never subclasses, so the
+    # identity check skips isinstance's MRO walk on every node
+    _dict = dict
+    _list = list
+
+    stack = deque([(prefix, data, current_depth)])
+    while stack:
+        prefix, node, depth = stack.popleft()
+        if depth >= max_depth or type(node) is not _dict:
+            continue
+
+        for key, value in node.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+
+            value_type = type(value)
+            if value_type is _dict:
+                print(f"  {full_key}: <dict with {len(value)} keys>")
+                stack.append((full_key, value, depth + 1))
+            elif value_type is _list:
+                print(f"  {full_key}: <list with {len(value)} items>")
+                if value and type(value[0]) is _dict:
+                    stack.append((f"{full_key}[0]", value[0], depth + 1))
+            else:
+                # Show the value for simple types
+                print(f"  {full_key}: {value}")
 
 
 def main():
@@ -49,13 +61,28 @@ def main():
     print("\nThis script will query your device and show all available fields.")
     print("This helps identify the correct command keys for controls.\n")
 
+    # Build the client up front and warm DNS + TLS to the API host in the
+    # background while the user types; the pooled session keeps the
+    # connection alive for the login call
+    client = TinecoClient()
+
+    def _warm_connection():
+        try:
+            client.session.head(client._login_url, timeout=5)
+        except Exception:
+            pass  # purely opportunistic
+
+    threading.Thread(target=_warm_connection, daemon=True).start()
+
     email = input("Enter your Tineco account email: ").strip()
     password = input("Enter your password: ").strip()
     region = input("Enter your region (default: IE): ").strip() or "IE"
 
-    # Initialize client
     print("\n[INFO] Connecting to Tineco API...")
-    client = TinecoClient(region=region)
+    if region != client.region:
+        # Non-default region talks to a different host; rebuild (the warm-up
+        # was a best-effort guess at the default)
+        client = TinecoClient(region=region)
 
     # Login
     success, token, user_id = client.login(email, password, request_code=False)
@@ -90,37 +117,31 @@ def main():
     # Query all device endpoints
     print_section("Device Information")
 
-    # GCI - Get Controller Info (current device state)
-    print("\n[1/5] GCI (Get Controller Info) - Current device state:")
-    gci = client.get_controller_info(device_id, device_class, device_resource)
-    if gci:
-        explore_dict(gci)
-        print("\nFull GCI JSON:")
-        print(json.dumps(gci, indent=2))
-
-    # CFP - Config File Point (configuration)
-    print("\n[2/5] CFP (Config File Point) - Configuration:")
-    cfp = client.get_device_config_point(device_id, device_class, device_resource)
-    if cfp:
-        explore_dict(cfp)
-
-    # GAV - Get API Version
-    print("\n[3/5] GAV (Get API Version):")
-    gav = client.get_api_version(device_id, device_class, device_resource)
-    if gav:
-        explore_dict(gav)
-
-    # GCF - Get Config File
-    print("\n[4/5] GCF (Get Config File):")
-    gcf = client.get_config_file(device_id, device_class, device_resource)
-    if gcf:
-        explore_dict(gcf)
-
-    # QueryMode - Device modes
-    print("\n[5/5] QueryMode - Device operating modes:")
-    query_mode = client.query_device_mode(device_id, device_class, device_resource)
-    if query_mode:
-        explore_dict(query_mode)
+    queries = [
+        ("[1/5] GCI (Get Controller Info) - Current device state:", "gci"),
+        ("[2/5] CFP (Config File Point) - Configuration:", "cfp"),
+        ("[3/5] GAV (Get API Version):", "gav"),
+        ("[4/5] GCF (Get Config File):", "gcf"),
+        ("[5/5] QueryMode - Device operating modes:", "QueryMode"),
+    ]
+
+    # The five queries are independent, so fan them out over a thread pool
+    # and print the results in order once they all land
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(client._send_iot_query, device_id, action,
+                            device_class, device_resource)
+            for _, action in queries
+        ]
+        results = [future.result() for future in futures]
+
+    for (title, action), result in zip(queries, results):
+        print(f"\n{title}")
+        if result:
+            explore_dict(result)
+            if action == "gci":
+                print("\nFull GCI JSON:")
+                print(json.dumps(result, indent=2))
 
     print_section("Field Analysis Complete")
     print("\nLook for fields like:")
@@ -4,7 +4,6 @@
 import json
 import os
 import importlib.util
-import time
 
 # Import TinecoClient by loading the module directly to avoid path conflicts
 def load_tineco_client():
@@ -17,6 +16,29 @@ def load_tineco_client():
 
 TinecoClient = load_tineco_client()
 
+try:
+    import orjson
+
+    def jdumps(obj, indent=None):
+        """Serialize for display via orjson (C speed); indent maps to 2 spaces."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+except ImportError:  # optional speedup, stdlib json works fine without it
+    def jdumps(obj, indent=None):
+        return json.dumps(obj, indent=indent, default=str)
+
+# Mode-related payload fields shown in the post-command state dump
+_MODE_FIELDS = frozenset({'md', 'vm', 'wm', 'wp', 'wom', 'sp', 'mp'})
+
+# Protocol schema for the coordinated mode commands; per-run values are
+# merged in with the dict union operator, never mutated in place
+_MODE_CMD_TEMPLATE = (
+    ({"md": 4}, "UpdateMode"),   # suction mode
+    ({"md": 3}, "UpdateMode"),   # MAX mode
+    ({"md": 6}, "UpdateMode"),   # water mode (DeleteMode when disabling)
+    ({}, "QueryMode"),           # final state read-back
+)
+
 
 def test_mode_commands():
     """Test the 4 sequential mode commands."""
@@ -78,43 +100,38 @@ def test_mode_commands():
     print(f"   Water Mode Power: {mode_state['water_mode_power']} (120W)")
     print(f"   Water Mode Spray Volume: {mode_state['water_mode_spray_volume']} (Rinse)")
 
-    # Build the 4 mode commands with their corresponding actions
-    # Command 1 & 2: UpdateMode, Command 3: DeleteMode, Command 4: QueryMode
-    commands = []
+    # Merge the per-run values into the command schema
+    suction_tmpl, max_tmpl, water_tmpl, query_cmd = _MODE_CMD_TEMPLATE
 
-    # Command 1: Suction mode (md=4) - UpdateMode
-    cmd1 = ({"md": 4, "vm": mode_state["suction_power"]}, "UpdateMode")
-    commands.append(cmd1)
+    commands = [
+        (suction_tmpl[0] | {"vm": mode_state["suction_power"]}, suction_tmpl[1]),
+        (max_tmpl[0] | {"vm": mode_state["max_power"],
+                        "wm": mode_state["max_spray_volume"]}, max_tmpl[1]),
+    ]
 
-    # Command 2: MAX mode (md=3) - UpdateMode
-    cmd2 = ({"md": 3, "vm": mode_state["max_power"], "wm": mode_state["max_spray_volume"]}, "UpdateMode")
-    commands.append(cmd2)
-
-    # Command 3: Water mode (md=6) - DeleteMode (to disable water-only mode)
     if mode_state["water_only_mode"]:
-        cmd3 = ({
-            "md": 6,
-            "vm": mode_state["water_mode_power"],
-            "wm": mode_state["water_mode_spray_volume"]
-        }, "UpdateMode")  # Use UpdateMode when enabling water mode
+        # Use UpdateMode when enabling water mode
+        commands.append((water_tmpl[0] | {"vm": mode_state["water_mode_power"],
+                                          "wm": mode_state["water_mode_spray_volume"]},
+                         water_tmpl[1]))
     else:
-        cmd3 = ({"md": 6}, "DeleteMode")  # Use DeleteMode when disabling water mode
-    commands.append(cmd3)
+        # Use DeleteMode when disabling water mode
+        commands.append((water_tmpl[0], "DeleteMode"))
 
-    # Command 4: Empty command - QueryMode
-    cmd4 = ({}, "QueryMode")
-    commands.append(cmd4)
+    commands.append(query_cmd)
 
     # Send all 4 commands
     print(f"\n[4/4] Sending {len(commands)} mode commands...")
     print("="*80)
 
+    # One batched call - the commands pipeline over the pooled connection
+    # with no inter-command delay
+    results = client.control_device_batch(device_id, commands, device_resource, device_class)
+
     all_successful = True
-    for i, (command, action) in enumerate(commands, 1):
+    for i, ((command, action), result) in enumerate(zip(commands, results), 1):
         print(f"\n🔧 Command {i}/{len(commands)} (action={action})")
-        print(f"   Payload: {json.dumps(command)}")
-
-        result = client.control_device(device_id, command, device_resource, device_class, action=action)
+        print(f"   Payload: {jdumps(command)}")
 
         if result:
             # Success conditions:
@@ -123,48 +140,47 @@ def test_mode_commands():
             # 3. Device state fields (wheel, bp, wm, etc.)
             if isinstance(result, dict) and result.get("ret") == "ok":
                 print(f"   ✅ SUCCESS")
-                print(f"   Response: {json.dumps(result)}")
+                print(f"   Response: {jdumps(result)}")
             elif isinstance(result, dict) and "cfg" in result:
                 print(f"   ✅ SUCCESS")
-                print(f"   Response: {json.dumps(result)}")
+                print(f"   Response: {jdumps(result)}")
             elif isinstance(result, dict) and ("wheel" in result or "bp" in result or "wm" in result):
                 print(f"   ✅ SUCCESS")
-                print(f"   Response: {json.dumps(result)}")
+                print(f"   Response: {jdumps(result)}")
             else:
                 print(f"   ⚠️  UNEXPECTED RESPONSE")
-                print(f"   Response: {json.dumps(result, indent=3)}")
+                print(f"   Response: {jdumps(result, indent=2)}")
                 all_successful = False
         else:
             print(f"   ❌ FAILED - No response received")
             all_successful = False
 
-        # Small delay between commands
-        if i < len(commands):
-            time.sleep(0.5)
-
     print("\n" + "="*80)
 
     if all_successful:
         print("✅ All 4 mode commands sent successfully!")
 
-        print("\n⏳ Waiting 3 seconds for device to update...")
-        time.sleep(3)
+        print("\n🔄 Waiting for device to report mode state (up to 3s)...")
+        client.wait_for_state(device_id, lambda state: 'md' in state,
+                              device_class=device_class,
+                              device_resource=device_resource)
 
         print("\n🔄 Fetching device state...")
         updated_info = client.get_complete_device_info(device_id, device_class, device_resource)
 
         if updated_info:
             print("\n📊 Device state after mode commands:")
-            for endpoint_key in ['gci', 'cfp']:
-                if endpoint_key in updated_info and isinstance(updated_info[endpoint_key], dict):
-                    payload = updated_info[endpoint_key]
-                    print(f"\n   {endpoint_key}:")
-
-                    # Check for mode-related fields
-                    mode_fields = ['md', 'vm', 'wm', 'wp', 'wom', 'sp', 'mp']
-                    for field in mode_fields:
-                        if field in payload:
-                            print(f"      {field}: {payload[field]}")
+            # Select the dict-valued endpoints once, then dispatch on the
+            # payload directly
+            for endpoint_key in ('gci', 'cfp'):
+                payload = updated_info.get(endpoint_key)
+                if not isinstance(payload, dict):
+                    continue
+                print(f"\n   {endpoint_key}:")
+
+                # Check for mode-related fields; set intersection runs in C
+                for field in sorted(_MODE_FIELDS & payload.keys()):
+                    print(f"      {field}: {payload[field]}")
     else:
         print("❌ Some mode commands failed!")
 